@@ -6,7 +6,7 @@ using the file_unf function with automatic format detection.
 """
 
 import pandas as pd
-from unf import file_unf
+from unf import file_unf, files_unf
 from unf.file_io import csv_unf, parquet_unf, stata_unf, excel_unf, json_unf
 from pathlib import Path
 import tempfile
@@ -79,9 +79,11 @@ def demonstrate_auto_detection():
         # Calculate UNF for each format (auto-detect)
         print("Format-specific UNFs (auto-detected):")
         print("-" * 70)
+        # The files are independent, so files_unf processes them concurrently
+        file_unfs = files_unf(list(formats.values()))
         unfs = {}
         for format_name, filepath in formats.items():
-            unf = file_unf(filepath)
+            unf = file_unfs[str(filepath)]
             unfs[format_name] = unf
             print(f"{format_name:10s}: {unf}")
 
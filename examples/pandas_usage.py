@@ -1,7 +1,7 @@
 """Pandas integration examples for the UNF library."""
 
 import pandas as pd
-from unf import series_unf, dataframe_unf, dataframe_column_unfs
+from unf import series_unf, dataframe_unf, dataframe_column_unfs, combine_unfs
 from unf.unf import UNFConfig
 
 
@@ -169,9 +169,9 @@ def example_real_world():
     print(df)
     print()
 
-    # Calculate UNFs
-    overall_unf = dataframe_unf(df)
+    # Calculate column UNFs once and combine them into the overall UNF
     column_unfs = dataframe_column_unfs(df)
+    overall_unf = combine_unfs(list(column_unfs.values()))
 
     print(f"Overall UNF: {overall_unf}")
     print("\nColumn UNFs:")
@@ -8,7 +8,7 @@ and calculate its UNF fingerprint, which can be useful for:
 """
 
 import pandas as pd
-from unf import dataframe_unf, dataframe_column_unfs
+from unf import combine_unfs, dataframe_unf, dataframe_column_unfs
 
 
 def calculate_stata_unf(filepath: str, verbose: bool = True):
@@ -35,12 +35,12 @@ def calculate_stata_unf(filepath: str, verbose: bool = True):
         print(df.head())
         print("\n" + "=" * 60)
 
-    # Calculate overall UNF
-    overall_unf = dataframe_unf(df)
-
     # Calculate individual column UNFs
     column_unfs = dataframe_column_unfs(df)
 
+    # Combine them into the overall UNF without hashing the columns again
+    overall_unf = combine_unfs(list(column_unfs.values()))
+
     if verbose:
         print(f"\nOverall Dataset UNF: {overall_unf}")
         print(f"\nIndividual Column UNFs:")
@@ -36,7 +36,7 @@ except ImportError:
 
 # File I/O integration (optional, requires pandas)
 try:
-    from .file_io import file_unf
+    from .file_io import file_unf, files_unf, files_unf_async
     _has_file_io = True
 except ImportError:
     _has_file_io = False
@@ -74,4 +74,6 @@ if _has_polars:
 if _has_file_io:
     __all__.extend([
         "file_unf",
+        "files_unf",
+        "files_unf_async",
     ])
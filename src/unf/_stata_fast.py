@@ -0,0 +1,221 @@
+"""Direct reader for numeric columns of Stata .dta files.
+
+This module parses just enough of a .dta file (formats 113-119) to locate
+the data section, then maps it into memory. Numeric columns are viewed as
+strided NumPy arrays straight from the mapped file, without building a
+DataFrame, and Stata's missing values (., .a-.z) come back as masked
+entries.
+
+Columns that pandas or pyreadstat would convert (dates, value-labelled
+variables, strings) are left to those readers.
+"""
+
+import re
+import struct
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+
+
+# NumPy type codes for Stata's numeric storage types, keyed on the type
+# codes of the old (113-115) and XML (117-119) formats
+_OLD_NUMERIC_TYPES = {251: 'i1', 252: 'i2', 253: 'i4', 254: 'f4', 255: 'f8'}
+_XML_NUMERIC_TYPES = {65530: 'i1', 65529: 'i2', 65528: 'i4', 65527: 'f4', 65526: 'f8'}
+
+# Type code of the XML format's long strings, stored as 8-byte references
+_STRL_TYPE = 32768
+
+# Range of non-missing values for each numeric type; values outside it
+# encode Stata's missing values . and .a-.z
+_VALID_RANGE = {
+    'i1': (-127, 100),
+    'i2': (-32767, 32740),
+    'i4': (-2147483647, 2147483620),
+    'f4': (
+        np.float32(struct.unpack('<f', b'\xff\xff\xff\xfe')[0]),
+        np.float32(struct.unpack('<f', b'\xff\xff\xff\x7e')[0]),
+    ),
+    'f8': (
+        np.float64(struct.unpack('<d', b'\xff\xff\xff\xff\xff\xff\xef\xff')[0]),
+        np.float64(struct.unpack('<d', b'\xff\xff\xff\xff\xff\xff\xdf\x7f')[0]),
+    ),
+}
+
+# Plain numeric display formats such as %9.0g, %-10.2f or %12.0fc. Other
+# formats (%td, %tc, ...) may make the readers convert the column to dates
+_NUMERIC_FORMAT = re.compile(r'%-?\d*(\.\d+)?[gfe]c?')
+
+
+class DtaLayout(NamedTuple):
+    """Location and storage types of the columns in a .dta file."""
+
+    names: list[str]
+    field_types: list[str]
+    formats: list[str]
+    value_labels: list[str]
+    nobs: int
+    byteorder: str
+    data_offset: int
+
+    def is_plain_numeric(self, index: int) -> bool:
+        """Check whether a column is numeric without date format or labels.
+
+        Such columns are read the same way by pandas and pyreadstat: as
+        numbers, with Stata's missing values as NaN.
+        """
+        return (
+            self.field_types[index] in _VALID_RANGE
+            and _NUMERIC_FORMAT.fullmatch(self.formats[index]) is not None
+            and not self.value_labels[index]
+        )
+
+
+def read_layout(filepath: str | Path) -> DtaLayout | None:
+    """Read the header and variable descriptors of a .dta file.
+
+    Args:
+        filepath: Path to the Stata file.
+
+    Returns:
+        The file layout, or None if the format version is not supported.
+    """
+    with open(filepath, 'rb') as f:
+        first = f.read(1)
+        if first == b'<':
+            return _read_xml_layout(f)
+        if first and first[0] in (113, 114, 115):
+            return _read_old_layout(f, first[0])
+    return None
+
+
+def read_numeric_column(layout: DtaLayout, filepath: str | Path, index: int) -> np.ndarray:
+    """View a numeric column of a .dta file as a NumPy array.
+
+    The array is a strided view into a read-only memory map of the file.
+    Missing values are masked.
+
+    Args:
+        layout: Layout returned by read_layout for the same file.
+        filepath: Path to the Stata file.
+        index: Position of the column; must be a numeric column.
+
+    Returns:
+        The column values, as a masked array if any are missing.
+    """
+    row_dtype = np.dtype([
+        (f's{i}', _field_dtype(field_type, layout.byteorder))
+        for i, field_type in enumerate(layout.field_types)
+    ])
+    rows = np.memmap(
+        filepath,
+        dtype=row_dtype,
+        mode='r',
+        offset=layout.data_offset,
+        shape=(layout.nobs,)
+    )
+    values = rows[f's{index}']
+
+    low, high = _VALID_RANGE[layout.field_types[index]]
+    missing = (values < low) | (values > high)
+    if missing.any():
+        return np.ma.masked_array(values, mask=missing)
+    return values
+
+
+def _field_dtype(field_type: str, byteorder: str) -> str:
+    """NumPy dtype of a field with the file's byte order."""
+    if field_type in _VALID_RANGE:
+        return byteorder + field_type
+    return field_type
+
+
+def _string_field(type_code: int) -> str:
+    """NumPy dtype of a fixed-width or strL string field."""
+    if type_code == _STRL_TYPE:
+        return 'V8'
+    return f'S{type_code}'
+
+
+def _decode(raw: bytes, encoding: str) -> str:
+    """Decode a null-terminated header field."""
+    return raw.partition(b'\0')[0].decode(encoding, errors='replace')
+
+
+def _read_old_layout(f: BinaryIO, version: int) -> DtaLayout:
+    """Read the fixed-width header used by formats 113-115."""
+    byteorder = '>' if f.read(1) == b'\x01' else '<'
+    f.read(2)  # filetype, unused
+    nvar, nobs = struct.unpack(f'{byteorder}HI', f.read(6))
+    f.read(81 + 18)  # data label, timestamp
+
+    types = list(f.read(nvar))
+    names = [_decode(f.read(33), 'latin-1') for _ in range(nvar)]
+    f.read(2 * (nvar + 1))  # sort order
+    format_size = 49 if version > 113 else 12
+    formats = [_decode(f.read(format_size), 'latin-1') for _ in range(nvar)]
+    value_labels = [_decode(f.read(33), 'latin-1') for _ in range(nvar)]
+    f.read(81 * nvar)  # variable labels
+
+    # Skip expansion fields, terminated by a zero type byte
+    while True:
+        field_type, field_len = struct.unpack(f'{byteorder}bi', f.read(5))
+        if field_type == 0:
+            break
+        f.read(field_len)
+
+    field_types = [
+        _OLD_NUMERIC_TYPES.get(code) or _string_field(code) for code in types
+    ]
+    return DtaLayout(
+        names, field_types, formats, value_labels, nobs, byteorder, f.tell()
+    )
+
+
+def _read_xml_layout(f: BinaryIO) -> DtaLayout | None:
+    """Read the tagged header and section map used by formats 117-119."""
+    f.read(27)  # stata_dta><header><release>
+    version = int(f.read(3))
+    if version not in (117, 118, 119):
+        return None
+    encoding = 'latin-1' if version < 118 else 'utf-8'
+
+    f.read(21)  # </release><byteorder>
+    byteorder = '>' if f.read(3) == b'MSF' else '<'
+    f.read(15)  # </byteorder><K>
+    nvar_format = 'H' if version <= 118 else 'I'
+    (nvar,) = struct.unpack(byteorder + nvar_format, f.read(struct.calcsize(nvar_format)))
+    f.read(7)  # </K><N>
+    nobs_format = 'I' if version == 117 else 'Q'
+    (nobs,) = struct.unpack(byteorder + nobs_format, f.read(struct.calcsize(nobs_format)))
+
+    # Skip to the section map, which holds the offsets of the other sections
+    f.read(11)  # </N><label>
+    label_len = f.read(1 if version == 117 else 2)
+    f.read(int.from_bytes(label_len, 'big' if byteorder == '>' else 'little'))
+    f.read(19)  # </label><timestamp>
+    f.read(f.read(1)[0])
+    f.read(26)  # </timestamp></header><map>
+    offsets = struct.unpack(f'{byteorder}14Q', f.read(14 * 8))
+
+    f.seek(offsets[2] + 16)  # <variable_types>
+    types = struct.unpack(f'{byteorder}{nvar}H', f.read(2 * nvar))
+
+    name_size = 33 if version == 117 else 129
+    f.seek(offsets[3] + 10)  # <varnames>
+    names = [_decode(f.read(name_size), encoding) for _ in range(nvar)]
+
+    format_size = 49 if version == 117 else 57
+    f.seek(offsets[5] + 9)  # <formats>
+    formats = [_decode(f.read(format_size), encoding) for _ in range(nvar)]
+
+    f.seek(offsets[6] + 19)  # <value_label_names>
+    value_labels = [_decode(f.read(name_size), encoding) for _ in range(nvar)]
+
+    field_types = [
+        _XML_NUMERIC_TYPES.get(code) or _string_field(code) for code in types
+    ]
+    return DtaLayout(
+        names, field_types, formats, value_labels, nobs, byteorder,
+        offsets[9] + 6  # <data>
+    )
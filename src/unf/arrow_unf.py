@@ -0,0 +1,121 @@
+"""Arrow support for UNF calculation.
+
+This module calculates column UNFs straight from pyarrow arrays, as read
+from Parquet and Feather files, without converting them to pandas. Only
+types whose values come out of pandas unchanged are handled here: integer,
+floating point and boolean numbers, and strings. Other columns are left to
+the pandas readers.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from .unf import UNFConfig, _fingerprint, _normalize_numeric_array
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class _NotStreamable(Exception):
+    """Raised when a column batch cannot be hashed without pandas."""
+
+
+def _is_streamable_type(arrow_type: Any) -> bool:
+    """Check whether columns of an Arrow type may be hashed from Arrow."""
+    import pyarrow.types as pa_types
+
+    return (
+        pa_types.is_integer(arrow_type)
+        or pa_types.is_floating(arrow_type)
+        or pa_types.is_boolean(arrow_type)
+        or pa_types.is_string(arrow_type)
+        or pa_types.is_large_string(arrow_type)
+    )
+
+
+def _arrow_numeric_values(column: Any) -> "np.ndarray | None":
+    """Return a numeric Arrow column as a NumPy array, if that is exact.
+
+    Integer, floating point and boolean columns convert without copying
+    when they have no nulls, and give the same values pandas would. Null
+    floats become NaN, which calculate_unf treats as missing. Integer and
+    boolean columns with nulls depend on the pandas metadata for their
+    dtype, so they return None and go through pandas instead.
+    """
+    import pyarrow.types as pa_types
+
+    arrow_type = column.type
+    if pa_types.is_floating(arrow_type) and not pa_types.is_float16(arrow_type):
+        return column.to_numpy()
+    if pa_types.is_integer(arrow_type) or pa_types.is_boolean(arrow_type):
+        if column.null_count == 0:
+            return column.to_numpy()
+    return None
+
+
+def _normalize_string_chunks(column: Any, config: UNFConfig) -> Iterator[bytes]:
+    """Build the normalized byte stream of an Arrow string column.
+
+    Truncation, terminators and missing values are applied with Arrow
+    compute kernels. The data buffer of the result is then exactly the
+    normalized stream, so it is hashed without creating a Python string
+    per value.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.types as pa_types
+
+    string_type = column.type
+    offset_type = np.int64 if pa_types.is_large_string(string_type) else np.int32
+    missing = pa.scalar('\000\000\000', string_type)
+    terminator = pa.scalar('\n\000', string_type)
+    empty = pa.scalar('', string_type)
+
+    for chunk in column.chunks:
+        truncated = pc.utf8_slice_codeunits(chunk, 0, config.max_chars)
+        # A value that truncates to the missing token is not terminated
+        terminators = pc.if_else(pc.equal(truncated, missing), empty, terminator)
+        normalized = pc.fill_null(
+            pc.binary_join_element_wise(truncated, terminators, empty),
+            missing
+        )
+
+        _, offsets, data = normalized.buffers()
+        offsets = np.frombuffer(offsets, dtype=offset_type)
+        first = offsets[normalized.offset]
+        last = offsets[normalized.offset + len(normalized)]
+        yield memoryview(data)[first:last]
+
+
+def _arrow_column_unf(
+    batches: Iterable[Any],
+    config: UNFConfig | None = None
+) -> str | None:
+    """Calculate the UNF of a column from a stream of Arrow batches.
+
+    Each batch is a ChunkedArray. It is normalized and fed to the hash
+    before the next one is read, so only one batch of the column is in
+    memory at a time.
+
+    Returns:
+        The column UNF, or None if a batch needs pandas conversion.
+    """
+    import pyarrow.types as pa_types
+
+    if config is None:
+        config = UNFConfig()
+
+    def chunks():
+        for batch in batches:
+            if pa_types.is_string(batch.type) or pa_types.is_large_string(batch.type):
+                yield from _normalize_string_chunks(batch, config)
+                continue
+            values = _arrow_numeric_values(batch)
+            if values is None:
+                raise _NotStreamable
+            yield from _normalize_numeric_array(values, config)
+
+    try:
+        return _fingerprint(chunks(), config)
+    except _NotStreamable:
+        return None
@@ -5,8 +5,11 @@ various file formats supported by pandas, including CSV, Parquet, Stata, SAS,
 SPSS, Excel, and more.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from .unf import UNFConfig
 
@@ -14,6 +17,20 @@ if TYPE_CHECKING:
     import pandas as pd
 
 
+# CSV files at least this large (in bytes) are hashed chunk by chunk when
+# no reader options are given
+STREAMING_THRESHOLD = 256 * 1024 * 1024
+
+# Rows per chunk when streaming CSV files. The C parser reads in blocks
+# of a power of two rows, at most 2**19, so chunks of 2**20 rows always
+# consist of whole blocks.
+_CSV_CHUNK_ROWS = 2 ** 20
+
+# Rows per batch when streaming Parquet columns. Row groups written by
+# pandas/pyarrow default to about a million rows, so batches are read
+# from within row groups to keep memory use bounded.
+_PARQUET_BATCH_ROWS = 65536
+
 # Format detection mapping
 FORMAT_EXTENSIONS = {
     '.csv': 'csv',
@@ -34,8 +51,12 @@ FORMAT_EXTENSIONS = {
 }
 
 
+@lru_cache(maxsize=1)
 def _ensure_pandas():
-    """Ensure pandas is available."""
+    """Ensure pandas is available, and return the module.
+
+    The result is cached, so per-file calls skip the import machinery.
+    """
     try:
         import pandas as pd
         return pd
@@ -46,6 +67,16 @@ def _ensure_pandas():
         )
 
 
+def _file_size(filepath: Any) -> int:
+    """Size in bytes of a local file, or 0 for buffers and unreadable paths."""
+    if not isinstance(filepath, (str, Path)):
+        return 0
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return 0
+
+
 def csv_unf(
     filepath: str | Path,
     config: UNFConfig | None = None,
@@ -63,14 +94,69 @@ def csv_unf(
     Returns:
         UNF string, or dict with UNF and metadata if return_metadata=True.
 
+    Note:
+        Passing chunksize reads and hashes the file that many rows at a
+        time, so only one chunk is held in memory. Files of at least
+        STREAMING_THRESHOLD bytes read without other options are streamed
+        this way automatically. pandas infers column types chunk by
+        chunk; if a column's type differs between chunks (an integer
+        column with blanks only in a later chunk, say) the file is read
+        again in one piece so the UNF matches a full read. Buffers are
+        rewound for the reread, which raises ValueError if they are not
+        seekable. Passing dtype= avoids such rereads.
+
+        Large files parse considerably faster with engine="pyarrow", which
+        reads blocks on multiple threads. The pyarrow parser infers types
+        differently from the default parser (ISO timestamps become
+        datetimes, for example), so the UNF of such columns can differ.
+        The default parser is kept so that existing fingerprints stay
+        stable.
+
     Examples:
         >>> from unf.file_io import csv_unf
         >>> unf = csv_unf("data.csv")
         >>> unf = csv_unf("data.tsv", sep="\\t")
+        >>> unf = csv_unf("large.csv", engine="pyarrow")
+        >>> unf = csv_unf("large.csv", chunksize=1_000_000)
     """
     pd = _ensure_pandas()
     from .pandas_unf import dataframe_unf
 
+    size = 0 if kwargs else _file_size(filepath)
+    if size and size >= STREAMING_THRESHOLD:
+        kwargs = {'chunksize': _CSV_CHUNK_ROWS, 'memory_map': True}
+
+    if kwargs.get('chunksize'):
+        # Remember where a buffer starts, so it can be reread from there
+        start = None
+        if hasattr(filepath, 'seekable') and filepath.seekable():
+            start = filepath.tell()
+        streamed = _csv_chunked_unf(filepath, config, **kwargs)
+        if streamed is not None:
+            unf, shape, columns = streamed
+            if return_metadata:
+                return {
+                    'unf': unf,
+                    'format': 'csv',
+                    'shape': shape,
+                    'columns': columns,
+                    'filepath': str(filepath)
+                }
+            return unf
+        kwargs = {key: value for key, value in kwargs.items() if key != 'chunksize'}
+        if start is not None:
+            filepath.seek(start)
+        elif not isinstance(filepath, (str, Path)):
+            raise ValueError(
+                "Column types differ between chunks, and the CSV input "
+                "cannot be reread as it is not seekable. Pass dtype= or "
+                "omit chunksize."
+            )
+
+    if size > 0 and not kwargs:
+        # Let the C parser read straight from a memory map of the file
+        kwargs['memory_map'] = True
+
     df = pd.read_csv(filepath, **kwargs)
     unf = dataframe_unf(df, config)
 
@@ -85,10 +171,69 @@ def csv_unf(
     return unf
 
 
+def _csv_chunked_unf(
+    filepath: str | Path,
+    config: UNFConfig | None = None,
+    **kwargs: Any
+) -> tuple[str, tuple[int, int], list[Any]] | None:
+    """Calculate a CSV file's UNF from chunks of rows.
+
+    Each column has its own running SHA256, which every chunk's slice of
+    the column is fed into, so the file is never parsed as a whole.
+
+    Returns:
+        Tuple of (UNF, shape, column names), or None if the types pandas
+        inferred for a column differ between chunks, or could differ from
+        those of a full read.
+    """
+    import hashlib
+
+    pd = _ensure_pandas()
+    from .pandas_unf import _series_stream
+    from .unf import _format_unf, combine_unfs
+
+    if config is None:
+        config = UNFConfig()
+
+    columns: list[Any] = []
+    dtypes: list[Any] = []
+    hashers: list[Any] = []
+    num_rows = 0
+    with pd.read_csv(filepath, **kwargs) as reader:
+        for chunk in reader:
+            if not hashers:
+                columns = list(chunk.columns)
+                dtypes = list(chunk.dtypes)
+                hashers = [hashlib.sha256() for _ in columns]
+                # With low_memory, the C parser infers types in blocks of
+                # rows and merges them; mixed blocks give object columns
+                # holding both numbers and strings. Chunks aligned to
+                # _CSV_CHUNK_ROWS are made of the same blocks as a full
+                # read, so such columns only come out identical then.
+                if kwargs['chunksize'] % _CSV_CHUNK_ROWS and any(
+                    dtype == object for dtype in dtypes
+                ):
+                    return None
+            elif list(chunk.dtypes) != dtypes:
+                return None
+
+            num_rows += len(chunk)
+            for position, hasher in enumerate(hashers):
+                for piece in _series_stream(chunk.iloc[:, position], config):
+                    hasher.update(piece)
+
+    shape = (num_rows, len(columns))
+    if num_rows == 0 or not columns:
+        return combine_unfs([], config), shape, columns
+    column_unfs = [_format_unf(hasher.digest(), config) for hasher in hashers]
+    return combine_unfs(column_unfs, config), shape, columns
+
+
 def parquet_unf(
     filepath: str | Path,
     config: UNFConfig | None = None,
     return_metadata: bool = False,
+    columns: list[str] | None = None,
     **kwargs: Any
 ) -> str | dict[str, Any]:
     """Calculate UNF for a Parquet file.
@@ -97,6 +242,10 @@ def parquet_unf(
         filepath: Path to Parquet file.
         config: Optional UNF configuration.
         return_metadata: If True, return dict with UNF and file metadata.
+        columns: Optional list of columns to include. Only these columns
+            are read from disk. As the dataset UNF does not depend on
+            column order, any ordering of the same columns gives the
+            same UNF.
         **kwargs: Additional arguments passed to pd.read_parquet().
 
     Returns:
@@ -105,12 +254,27 @@ def parquet_unf(
     Examples:
         >>> from unf.file_io import parquet_unf
         >>> unf = parquet_unf("data.parquet")
+        >>> unf = parquet_unf("data.parquet", columns=["id", "score"])
     """
     pd = _ensure_pandas()
     from .pandas_unf import dataframe_unf
 
+    if not kwargs:
+        streamed = _parquet_column_unfs(filepath, config, columns)
+        if streamed is not None:
+            unf, shape, columns = streamed
+            if return_metadata:
+                return {
+                    'unf': unf,
+                    'format': 'parquet',
+                    'shape': shape,
+                    'columns': columns,
+                    'filepath': str(filepath)
+                }
+            return unf
+
     try:
-        df = pd.read_parquet(filepath, **kwargs)
+        df = pd.read_parquet(filepath, columns=columns, **kwargs)
     except ImportError as e:
         raise ImportError(
             "pyarrow or fastparquet is required to read Parquet files. "
@@ -130,10 +294,122 @@ def parquet_unf(
     return unf
 
 
+def _parquet_column_unfs(
+    filepath: str | Path,
+    config: UNFConfig | None = None,
+    columns: list[str] | None = None
+) -> tuple[str, tuple[int, int], list[Any]] | None:
+    """Calculate a Parquet file's UNF one column at a time.
+
+    Numeric and string columns are decoded and hashed in batches of
+    _PARQUET_BATCH_ROWS rows, so their memory use does not grow with the
+    file. Other columns are read one whole column at a time, so peak
+    memory is at most one column rather than the whole table.
+
+    Returns:
+        Tuple of (UNF, shape, column names), or None if pyarrow is not
+        available or the file's column layout needs a full read.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+
+    pd = _ensure_pandas()
+
+    parquet_file = pq.ParquetFile(filepath)
+    return _arrow_columns_unf(
+        parquet_file.schema_arrow,
+        parquet_file.metadata.num_rows,
+        lambda name: (
+            pa.chunked_array([batch.column(0)])
+            for batch in parquet_file.iter_batches(
+                batch_size=_PARQUET_BATCH_ROWS, columns=[name]
+            )
+        ),
+        lambda name: pd.read_parquet(filepath, columns=[name]),
+        config,
+        columns
+    )
+
+
+def _arrow_columns_unf(
+    schema: Any,
+    num_rows: int,
+    read_batches: Callable[[str], Iterable[Any]],
+    read_pandas: Callable[[str], "pd.DataFrame"],
+    config: UNFConfig | None = None,
+    columns: list[str] | None = None
+) -> tuple[str, tuple[int, int], list[Any]] | None:
+    """Calculate the UNF of an Arrow-backed file column by column.
+
+    Numeric and string columns are hashed straight from their Arrow
+    buffers, batch by batch. Other columns are read through pandas one at a
+    time so they get exactly the dtypes a full pd.read_* call would give
+    them. Index columns recorded in the pandas metadata are skipped, as
+    pandas turns them into the index.
+
+    Args:
+        schema: Arrow schema of the file.
+        num_rows: Number of rows in the file.
+        read_batches: Reads a single column as an iterable of Arrow arrays.
+        read_pandas: Reads a single column as a pandas DataFrame.
+        config: Optional UNF configuration.
+        columns: Optional subset of the columns to include, in order.
+
+    Returns:
+        Tuple of (UNF, shape, column names), or None if the column layout
+        (MultiIndex or duplicate column names) or the column selection
+        needs a full read.
+    """
+    from .arrow_unf import _arrow_column_unf, _is_streamable_type
+    from .pandas_unf import series_unf
+    from .unf import combine_unfs
+
+    pandas_metadata = schema.pandas_metadata or {}
+    if len(pandas_metadata.get('column_indexes', [])) > 1:
+        return None
+    if len(set(schema.names)) != len(schema.names):
+        return None
+
+    index_columns = {
+        name for name in pandas_metadata.get('index_columns', [])
+        if isinstance(name, str)
+    }
+    if columns is None:
+        names = [name for name in schema.names if name not in index_columns]
+    else:
+        # Leave unknown, repeated or index columns for pandas to handle
+        available = set(schema.names) - index_columns
+        if len(set(columns)) != len(columns) or not available.issuperset(columns):
+            return None
+        names = list(columns)
+
+    read_columns = []
+    column_unfs = []
+    for name in names:
+        if _is_streamable_type(schema.field(name).type):
+            unf = _arrow_column_unf(read_batches(name), config)
+            if unf is not None:
+                read_columns.append(name)
+                column_unfs.append(unf)
+                continue
+        df = read_pandas(name)
+        read_columns.extend(df.columns)
+        column_unfs.extend(series_unf(df[column], config) for column in df.columns)
+
+    shape = (num_rows, len(read_columns))
+    if num_rows == 0 or not read_columns:
+        return combine_unfs([], config), shape, read_columns
+    return combine_unfs(column_unfs, config), shape, read_columns
+
+
 def feather_unf(
     filepath: str | Path,
     config: UNFConfig | None = None,
     return_metadata: bool = False,
+    columns: list[str] | None = None,
     **kwargs: Any
 ) -> str | dict[str, Any]:
     """Calculate UNF for a Feather file.
@@ -142,6 +418,10 @@ def feather_unf(
         filepath: Path to Feather file.
         config: Optional UNF configuration.
         return_metadata: If True, return dict with UNF and file metadata.
+        columns: Optional list of columns to include. Only these columns
+            are read from disk. As the dataset UNF does not depend on
+            column order, any ordering of the same columns gives the
+            same UNF.
         **kwargs: Additional arguments passed to pd.read_feather().
 
     Returns:
@@ -154,13 +434,30 @@ def feather_unf(
     pd = _ensure_pandas()
     from .pandas_unf import dataframe_unf
 
+    if not kwargs:
+        streamed = _feather_column_unfs(filepath, config, columns)
+        if streamed is not None:
+            unf, shape, columns = streamed
+            if return_metadata:
+                return {
+                    'unf': unf,
+                    'format': 'feather',
+                    'shape': shape,
+                    'columns': columns,
+                    'filepath': str(filepath)
+                }
+            return unf
+
     try:
-        df = pd.read_feather(filepath, **kwargs)
+        df = pd.read_feather(filepath, columns=columns, **kwargs)
     except ImportError as e:
         raise ImportError(
             "pyarrow is required to read Feather files. "
             "Install with: pip install pyarrow"
         ) from e
+    if columns is not None and not columns:
+        # pd.read_feather reads every column for an empty selection
+        df = df[[]]
 
     unf = dataframe_unf(df, config)
 
@@ -175,6 +472,44 @@ def feather_unf(
     return unf
 
 
+def _feather_column_unfs(
+    filepath: str | Path,
+    config: UNFConfig | None = None,
+    columns: list[str] | None = None
+) -> tuple[str, tuple[int, int], list[Any]] | None:
+    """Calculate a Feather file's UNF from a memory-mapped Arrow table.
+
+    Numeric and string columns are hashed directly from the mapped
+    buffers without building a DataFrame.
+
+    Returns:
+        Tuple of (UNF, shape, column names), or None if pyarrow is not
+        available or the file's column layout needs a full read.
+    """
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+
+    pd = _ensure_pandas()
+
+    table = feather.read_table(filepath, memory_map=True)
+    if columns is not None:
+        # pd.read_feather returns selected columns in file order
+        if not set(columns).issubset(table.schema.names):
+            return None
+        columns = [name for name in table.schema.names if name in columns]
+
+    return _arrow_columns_unf(
+        table.schema,
+        table.num_rows,
+        lambda name: [table.column(name)],
+        lambda name: pd.read_feather(filepath, columns=[name]),
+        config,
+        columns
+    )
+
+
 def stata_unf(
     filepath: str | Path,
     config: UNFConfig | None = None,
@@ -199,6 +534,20 @@ def stata_unf(
     pd = _ensure_pandas()
     from .pandas_unf import dataframe_unf
 
+    if not kwargs:
+        streamed = _stata_column_unfs(filepath, config)
+        if streamed is not None:
+            unf, shape, columns = streamed
+            if return_metadata:
+                return {
+                    'unf': unf,
+                    'format': 'stata',
+                    'shape': shape,
+                    'columns': columns,
+                    'filepath': str(filepath)
+                }
+            return unf
+
     df = pd.read_stata(filepath, **kwargs)
     unf = dataframe_unf(df, config)
 
@@ -213,6 +562,46 @@ def stata_unf(
     return unf
 
 
+def _stata_column_unfs(
+    filepath: str | Path,
+    config: UNFConfig | None = None
+) -> tuple[str, tuple[int, int], list[Any]] | None:
+    """Calculate a Stata file's UNF, hashing numeric columns in place.
+
+    Plain numeric columns are hashed from a memory map of the file's data
+    section. Date, value-labelled and string columns are read with
+    pd.read_stata so they are converted exactly as a full read would.
+
+    Returns:
+        Tuple of (UNF, shape, column names), or None if the file's format
+        version is not supported by the direct reader or it has no rows.
+    """
+    pd = _ensure_pandas()
+    from ._stata_fast import read_layout, read_numeric_column
+    from .pandas_unf import series_unf
+    from .unf import calculate_unf, combine_unfs
+
+    layout = read_layout(filepath)
+    if layout is None or layout.nobs == 0 or not layout.names:
+        return None
+
+    column_unfs = []
+    other_columns = []
+    for index, name in enumerate(layout.names):
+        if layout.is_plain_numeric(index):
+            values = read_numeric_column(layout, filepath, index)
+            column_unfs.append(calculate_unf(values, config))
+        else:
+            other_columns.append(name)
+
+    if other_columns:
+        df = pd.read_stata(filepath, columns=other_columns)
+        column_unfs.extend(series_unf(df[column], config) for column in df.columns)
+
+    shape = (layout.nobs, len(layout.names))
+    return combine_unfs(column_unfs, config), shape, list(layout.names)
+
+
 def sas_unf(
     filepath: str | Path,
     config: UNFConfig | None = None,
@@ -383,6 +772,20 @@ def json_unf(
     return unf
 
 
+# Format-specific UNF functions, keyed on the names used by file_unf and
+# FORMAT_EXTENSIONS
+FORMAT_READERS: dict[str, Callable[..., str | dict[str, Any]]] = {
+    'csv': csv_unf,
+    'parquet': parquet_unf,
+    'feather': feather_unf,
+    'stata': stata_unf,
+    'sas': sas_unf,
+    'spss': spss_unf,
+    'excel': excel_unf,
+    'json': json_unf,
+}
+
+
 def file_unf(
     filepath: str | Path,
     format: str | None = None,
@@ -432,11 +835,9 @@ def file_unf(
         >>> print(result['unf'])
         >>> print(result['shape'])
     """
-    path = Path(filepath)
-
     # Detect format from extension if not provided
     if format is None:
-        suffix = path.suffix.lower()
+        suffix = os.path.splitext(os.fspath(filepath))[1].lower()
         format = FORMAT_EXTENSIONS.get(suffix)
         if format is None:
             raise ValueError(
@@ -446,25 +847,84 @@ def file_unf(
             )
 
     # Dispatch to format-specific function
-    format_lower = format.lower()
-    if format_lower == 'csv':
-        return csv_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'parquet':
-        return parquet_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'feather':
-        return feather_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'stata':
-        return stata_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'sas':
-        return sas_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'spss':
-        return spss_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'excel':
-        return excel_unf(filepath, config, return_metadata, **kwargs)
-    elif format_lower == 'json':
-        return json_unf(filepath, config, return_metadata, **kwargs)
-    else:
+    reader = FORMAT_READERS.get(format.lower())
+    if reader is None:
         raise ValueError(
             f"Unsupported format: '{format}'. "
-            f"Supported formats: csv, parquet, feather, stata, sas, spss, excel, json"
+            f"Supported formats: {', '.join(FORMAT_READERS)}"
         )
+    return reader(filepath, config, return_metadata, **kwargs)
+
+
+def files_unf(
+    filepaths: list[str | Path],
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
+) -> dict[str, str]:
+    """Calculate UNFs for several files concurrently.
+
+    Each file is handled by file_unf with its format detected from the
+    extension. Files are processed in a thread pool: reading from disk and
+    SHA256 hashing both release the GIL, so I/O for one file overlaps with
+    work on the others.
+
+    Args:
+        filepaths: Paths to the files.
+        config: Optional UNF configuration.
+        max_workers: Number of threads. Defaults to one per file, at most 8.
+
+    Returns:
+        Dictionary mapping each path (as given, converted to str) to its UNF.
+
+    Examples:
+        >>> from unf import files_unf
+        >>> unfs = files_unf(["data.csv", "data.parquet", "data.dta"])
+        >>> unfs["data.csv"] == unfs["data.parquet"]
+        True
+    """
+    if not filepaths:
+        return {}
+
+    if max_workers is None:
+        max_workers = min(8, len(filepaths))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        unfs = executor.map(lambda path: file_unf(path, config=config), filepaths)
+        return {str(path): unf for path, unf in zip(filepaths, unfs)}
+
+
+async def files_unf_async(
+    filepaths: list[str | Path],
+    config: UNFConfig | None = None,
+    max_concurrency: int = 8
+) -> dict[str, str]:
+    """Calculate UNFs for several files from asyncio code.
+
+    The asyncio counterpart of files_unf, for use inside an event loop.
+    Each file is handled by file_unf in a worker thread, with at most
+    max_concurrency files in flight at once, so the event loop is never
+    blocked and the disk is not flooded with requests.
+
+    Args:
+        filepaths: Paths to the files.
+        config: Optional UNF configuration.
+        max_concurrency: Maximum number of files processed at a time.
+
+    Returns:
+        Dictionary mapping each path (as given, converted to str) to its UNF.
+
+    Examples:
+        >>> import asyncio
+        >>> from unf import files_unf_async
+        >>> unfs = asyncio.run(files_unf_async(["data.csv", "data.parquet"]))
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def one_file(path: str | Path) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(file_unf, path, config=config)
+
+    unfs = await asyncio.gather(*(one_file(path) for path in filepaths))
+    return {str(path): unf for path, unf in zip(filepaths, unfs)}
@@ -7,8 +7,13 @@ according to the UNF v6 specification.
 import math
 from datetime import date, datetime, time
 from decimal import Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Sequence
 import base64
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def normalize_numeric(
     value: float | int | None,
@@ -37,61 +42,135 @@ def normalize_numeric(
         >>> normalize_numeric(None)
         '\\x00\\x00\\x00'
     """
-    if value is None:
-        return '\000\000\000'
+    return _numeric_normalizer(precision, round_mode)(value)
+
+
+# Decimal(10 ** exponent) for each exponent seen so far. For negative
+# exponents 10 ** exponent is a float, and its exact binary value is what
+# normalize_numeric has always divided by, so the cache stores exactly
+# that rather than an exact power of ten.
+_POW10: dict[int, Decimal] = {}
+
+
+def _pow10(exponent: int) -> Decimal:
+    """Return Decimal(10 ** exponent), computing it once per exponent."""
+    power = _POW10.get(exponent)
+    if power is None:
+        power = _POW10[exponent] = Decimal(10 ** exponent)
+    return power
+
 
-    # Handle special float values
-    if math.isnan(value):
-        return '+nan'
-    if math.isinf(value):
-        return '+inf' if value > 0 else '-inf'
-
-    # Handle zeros with sign preservation
-    if value == 0.0:
-        # Use copysign to detect -0.0
-        if math.copysign(1.0, value) < 0:
-            return '-0.e+'
-        return '+0.e+'
-
-    # Determine sign
-    sign = '+' if value >= 0 else '-'
-    abs_value = abs(value)
-
-    # Convert to decimal for precise rounding
-    decimal_value = Decimal(str(abs_value))
-
-    # Calculate the exponent
-    exponent = math.floor(math.log10(abs_value))
-
-    # Scale to get significant digits
-    scaled = decimal_value / Decimal(10 ** exponent)
-
-    # Round or truncate to N significant digits
-    if round_mode:
-        # Round to N-1 decimal places (since we have 1 digit before decimal)
-        factor = Decimal(10 ** (precision - 1))
-        rounded = (scaled * factor).quantize(Decimal('1'), rounding=ROUND_HALF_EVEN) / factor
-    else:
-        # Truncate
-        factor = Decimal(10 ** (precision - 1))
-        rounded = Decimal(int(scaled * factor)) / factor
-
-    # Format the mantissa
-    mantissa_str = f"{rounded:.{precision-1}f}"
-
-    # Remove trailing zeros after decimal point
-    if '.' in mantissa_str:
-        mantissa_str = mantissa_str.rstrip('0').rstrip('.')
-        if '.' not in mantissa_str:
+@lru_cache(maxsize=16)
+def _numeric_normalizer(
+    precision: int,
+    round_mode: bool
+) -> Callable[[float | int | None], str]:
+    """Build a normalize_numeric specialized for one precision and mode.
+
+    The scaling factor and mantissa format depend only on the precision, so
+    they are computed once when the closure is built rather than for every
+    value.
+    """
+    factor = _pow10(precision - 1)
+    one = Decimal('1')
+    mantissa_format = f".{precision-1}f"
+    # Integers with at most `precision` digits need no rounding, so their
+    # digits are the mantissa as they are. Past 12 digits, math.log10 of
+    # values just below a power of ten rounds up to it, which the general
+    # path turns into a different (but long-standing) result
+    exact_limit = 10 ** min(precision, 12)
+
+    def normalize(value: float | int | None) -> str:
+        if value is None:
+            return '\000\000\000'
+
+        # Handle special float values
+        if math.isnan(value):
+            return '+nan'
+        if math.isinf(value):
+            return '+inf' if value > 0 else '-inf'
+
+        # Handle zeros with sign preservation
+        if value == 0.0:
+            # Use copysign to detect -0.0
+            if math.copysign(1.0, value) < 0:
+                return '-0.e+'
+            return '+0.e+'
+
+        # Determine sign
+        sign = '+' if value >= 0 else '-'
+        abs_value = abs(value)
+
+        if abs_value < exact_limit:
+            integer = int(abs_value)
+            if integer == abs_value:
+                digits = str(integer)
+                exponent = len(digits) - 1
+                mantissa_str = digits[0] + '.' + digits[1:].rstrip('0')
+                exp_str = f"+{exponent:02d}" if exponent != 0 else '+'
+                return f"{sign}{mantissa_str}e{exp_str}"
+
+        # Convert to decimal for precise rounding
+        decimal_value = Decimal(str(abs_value))
+
+        # Calculate the exponent
+        exponent = math.floor(math.log10(abs_value))
+
+        # Scale to get significant digits
+        scaled = decimal_value / _pow10(exponent)
+
+        # Round or truncate to N significant digits
+        if round_mode:
+            # Round to N-1 decimal places (since we have 1 digit before decimal)
+            rounded = (scaled * factor).quantize(one, rounding=ROUND_HALF_EVEN) / factor
+        else:
+            # Truncate
+            rounded = Decimal(int(scaled * factor)) / factor
+
+        # Format the mantissa
+        mantissa_str = format(rounded, mantissa_format)
+
+        # Remove trailing zeros after decimal point
+        if '.' in mantissa_str:
+            mantissa_str = mantissa_str.rstrip('0').rstrip('.')
+            if '.' not in mantissa_str:
+                mantissa_str += '.'
+        else:
             mantissa_str += '.'
-    else:
-        mantissa_str += '.'
 
-    # Format exponent with sign
-    exp_sign = '+' if exponent >= 0 else ''
-    exp_str = f"{exp_sign}{exponent:02d}" if exponent != 0 else '+'
+        # Format exponent with sign
+        exp_sign = '+' if exponent >= 0 else ''
+        exp_str = f"{exp_sign}{exponent:02d}" if exponent != 0 else '+'
+
+        return f"{sign}{mantissa_str}e{exp_str}"
+
+    return normalize
 
-    return f"{sign}{mantissa_str}e{exp_str}"
+
+def normalize_numeric_array(
+    values: Sequence[float | int],
+    precision: int = 7,
+    round_mode: bool = True
+) -> list[str]:
+    """Normalize a batch of numeric values according to UNF v6 specification.
+
+    Accepts NumPy arrays as well as plain sequences. Arrays are converted to
+    Python scalars in a single ``tolist()`` call before normalization, which
+    is much cheaper than iterating over NumPy scalar objects.
+
+    Args:
+        values: The numeric values to normalize.
+        precision: Number of significant digits (default 7).
+        round_mode: If True, round to nearest (default). If False, truncate.
+
+    Returns:
+        List of normalized string representations, one per value.
+    """
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+
+    normalize = _numeric_normalizer(precision, round_mode)
+    return [normalize(value) for value in values]
 
 
 def normalize_string(value: str | None, max_chars: int = 128) -> bytes:
@@ -114,6 +193,61 @@ def normalize_string(value: str | None, max_chars: int = 128) -> bytes:
     return truncated.encode('utf-8')
 
 
+def normalize_string_bytes(value: bytes | None, max_chars: int = 128) -> bytes:
+    """Normalize a UTF-8 encoded string value according to UNF v6 specification.
+
+    Gives the same result as normalize_string on the decoded string, for
+    callers that already hold UTF-8 bytes (from an Arrow buffer or a file,
+    say). Values of at most max_chars bytes, and longer ASCII values, are
+    truncated without decoding; only longer non-ASCII values are decoded
+    to find the character boundary.
+
+    Args:
+        value: The UTF-8 encoded string to normalize. Can be None for
+            missing values.
+        max_chars: Maximum number of characters to keep (default 128).
+
+    Returns:
+        UTF-8 encoded bytes (or b'\\x00\\x00\\x00' for None).
+    """
+    if value is None:
+        return b'\000\000\000'
+
+    # A character takes at least one byte, so short values need no cut
+    if len(value) <= max_chars:
+        return value
+    if value.isascii():
+        return value[:max_chars]
+    return value.decode('utf-8')[:max_chars].encode()
+
+
+def normalize_string_array(
+    values: Sequence[str | None],
+    max_chars: int = 128
+) -> list[bytes]:
+    """Normalize a batch of string values according to UNF v6 specification.
+
+    Equivalent to calling normalize_string on each value, but the slicing
+    and encoding run in a single comprehension without a Python function
+    call per element. Values that are already short enough are not
+    sliced, and str.encode() is called without arguments, which takes
+    CPython's UTF-8 fast path (a plain copy for ASCII strings) without
+    looking up the codec by name.
+
+    Args:
+        values: The strings to normalize. None entries are missing values.
+        max_chars: Maximum number of characters to keep (default 128).
+
+    Returns:
+        List of UTF-8 encoded bytes, one per value.
+    """
+    return [
+        b'\000\000\000' if value is None
+        else (value if len(value) <= max_chars else value[:max_chars]).encode()
+        for value in values
+    ]
+
+
 def normalize_boolean(value: bool | None) -> str:
     """Normalize a boolean value as numeric (0 or 1).
 
@@ -176,22 +310,49 @@ def normalize_datetime(value: datetime | None) -> str:
     """Normalize a datetime value according to UNF v6 specification.
 
     Args:
-        value: The datetime to normalize. Can be None for missing values.
+        value: The datetime to normalize. Can be None or pd.NaT for
+            missing values.
 
     Returns:
         ISO 8601 formatted datetime string (YYYY-MM-DDThh:mm:ss.fffffZ).
     """
-    if value is None:
+    # pd.NaT is the only datetime that compares unequal to itself
+    if value is None or value != value:
         return '\000\000\000'
 
     # Convert to UTC if timezone-aware
     if value.tzinfo is not None:
         value = value.astimezone(None).replace(tzinfo=None)
 
-    date_part = normalize_date(value.date())
-    time_part = normalize_time(value.time())
+    # Format date and time in one call rather than through normalize_date
+    # and normalize_time. The unbound method ignores the extra precision
+    # of subclasses such as pd.Timestamp, as value.time() did.
+    text = datetime.isoformat(value, timespec='seconds')
+    if value.microsecond > 0:
+        text += f".{value.microsecond:06d}".rstrip('0')
+
+    return text + 'Z'
+
+
+def normalize_datetime_array(values: "np.ndarray") -> list[str]:
+    """Normalize a NumPy array of naive datetime64 values.
+
+    Gives the same strings as normalize_datetime on the equivalent naive
+    datetimes, with sub-microsecond precision truncated, but formats the
+    whole array with NumPy's vectorized datetime_as_string.
+
+    Args:
+        values: One-dimensional datetime64 array without NaT entries.
+
+    Returns:
+        List of ISO 8601 datetime strings, one per value.
+    """
+    import numpy as np
 
-    return f"{date_part}T{time_part}"
+    text = np.datetime_as_string(values.astype('datetime64[us]'), unit='us')
+    # Strip trailing zeros of the fraction, and the point if nothing is left
+    text = np.char.rstrip(np.char.rstrip(text, '0'), '.')
+    return [value + 'Z' for value in text.tolist()]
 
 
 def normalize_bitfield(bits: list[bool] | None) -> str:
@@ -207,20 +368,15 @@ def normalize_bitfield(bits: list[bool] | None) -> str:
         return '\000\000\000'
 
     # Remove leading False values
-    while bits and not bits[0]:
-        bits = bits[1:]
+    digits = ''.join('1' if bit else '0' for bit in bits).lstrip('0')
 
-    if not bits:
+    if not digits:
         return '\000\000\000'
 
-    # Convert bits to bytes (big-endian)
-    byte_array = bytearray()
-    for i in range(0, len(bits), 8):
-        byte_val = 0
-        for j in range(8):
-            if i + j < len(bits) and bits[i + j]:
-                byte_val |= (1 << (7 - j))
-        byte_array.append(byte_val)
+    # Convert bits to bytes (big-endian), padding the last byte with zeros
+    num_bytes = (len(digits) + 7) // 8
+    digits = digits.ljust(num_bytes * 8, '0')
+    byte_string = int(digits, 2).to_bytes(num_bytes, 'big')
 
     # Base64 encode
-    return base64.b64encode(bytes(byte_array)).decode('ascii')
+    return base64.b64encode(byte_string).decode('ascii')
@@ -4,14 +4,104 @@ This module provides convenience functions for calculating UNF fingerprints
 directly from pandas Series and DataFrame objects.
 """
 
-from typing import TYPE_CHECKING
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Iterable
 
-from .unf import calculate_unf, UNFConfig
+from .unf import (
+    combine_unfs,
+    UNFConfig,
+    _fingerprint,
+    _map_unique_columns,
+    _normalize_codes,
+    _normalize_datetime_array,
+    _normalize_stream,
+)
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
+@lru_cache(maxsize=1)
+def _ensure_pandas():
+    """Ensure pandas is available, and return the module.
+
+    The result is cached, so per-column calls skip the import machinery.
+    """
+    try:
+        import pandas as pd
+        return pd
+    except ImportError:
+        raise ImportError(
+            "pandas is required for pandas_unf. "
+            "Install it with: pip install unf[pandas]"
+        )
+
+
+def _numeric_values(series: "pd.Series") -> "np.ndarray | None":
+    """Extract a numeric or boolean Series as a NumPy array.
+
+    Missing values in nullable extension dtypes (Int64, Float64, boolean,
+    pyarrow-backed) are returned as a masked array. Returns None for all
+    other dtypes, which go through the generic element-wise path.
+    """
+    import numpy as np
+
+    dtype = series.dtype
+    if dtype.kind not in 'biuf':
+        return None
+
+    numpy_dtype = getattr(dtype, 'numpy_dtype', None)
+    if numpy_dtype is None:
+        return series.to_numpy()
+
+    missing = series.isna().to_numpy()
+    values = series.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+    if missing.any():
+        return np.ma.masked_array(values, mask=missing)
+    return values
+
+
+def _datetime_values(series: "pd.Series") -> "np.ndarray | None":
+    """Extract a timezone-naive datetime Series as a datetime64 array.
+
+    Returns None for other dtypes (including timezone-aware datetimes), and
+    for timestamps outside the years 1-9999 that Python datetimes cover.
+    """
+    import numpy as np
+
+    if series.dtype.kind != 'M' or getattr(series.dtype, 'tz', None) is not None:
+        return None
+
+    values = series.to_numpy()
+    seconds = values[~np.isnat(values)].astype('datetime64[s]')
+    if len(seconds) and (
+        seconds.min() < np.datetime64('0001-01-01T00:00:00', 's')
+        or seconds.max() >= np.datetime64('10000-01-01T00:00:00', 's')
+    ):
+        return None
+    return values
+
+
+def _categorical_stream(series: "pd.Series", config: UNFConfig) -> Iterable[bytes]:
+    """Build the normalized byte stream of a categorical Series.
+
+    Each category in use is normalized once and looked up by code. The
+    category values are taken from the object conversion of the Series
+    itself, so they have exactly the types the generic path would see
+    (integer categories become floats when values are missing, say).
+    """
+    import numpy as np
+
+    codes = series.cat.codes.to_numpy()
+    used, first = np.unique(codes, return_index=True)
+    present = used >= 0
+
+    values = np.full(len(series.cat.categories), None, dtype=object)
+    values[used[present]] = series.to_numpy(dtype=object)[first[present]]
+    return _normalize_codes(values.tolist(), codes, config)
+
+
 def series_unf(series: "pd.Series", config: UNFConfig | None = None) -> str:
     """Calculate UNF for a pandas Series.
 
@@ -30,24 +120,71 @@ def series_unf(series: "pd.Series", config: UNFConfig | None = None) -> str:
         >>> print(unf)
         'UNF:6:...'
     """
-    try:
-        import pandas as pd
-    except ImportError:
-        raise ImportError(
-            "pandas is required for pandas_unf. "
-            "Install it with: pip install unf[pandas]"
-        )
+    pd = _ensure_pandas()
 
     if not isinstance(series, pd.Series):
         raise TypeError(f"Expected pd.Series, got {type(series)}")
 
-    # Convert Series to list, replacing pd.NA/pd.NaT with None
-    data = [None if pd.isna(x) else x for x in series]
+    if config is None:
+        config = UNFConfig()
+    return _fingerprint(_series_stream(series, config), config)
+
+
+def _series_stream(series: "pd.Series", config: UNFConfig) -> Iterable[bytes]:
+    """Build the normalized byte stream of a Series, in hashable chunks.
+
+    Streams of consecutive slices of a Series concatenate to the stream of
+    the whole Series, so a column can be hashed piece by piece.
+    """
+    # Naive datetime columns are formatted in bulk from NumPy
+    datetimes = _datetime_values(series)
+    if datetimes is not None:
+        return _normalize_datetime_array(datetimes, config)
+
+    # Categorical columns normalize each category once
+    if isinstance(series.dtype, _ensure_pandas().CategoricalDtype):
+        return _categorical_stream(series, config)
+
+    # Numeric and boolean columns are normalized in bulk from NumPy
+    data = _numeric_values(series)
+    if data is None:
+        # Convert Series to list, replacing pd.NA/pd.NaT with None using a
+        # single vectorized missing-value mask
+        values = series.to_numpy(dtype=object, copy=True)
+        values[series.isna().to_numpy()] = None
+        data = values.tolist()
+
+    return _normalize_stream(data, config)
+
+
+def _column_unfs(
+    columns: list["pd.Series"],
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
+) -> list[str]:
+    """Calculate the UNF of each column, hashing identical columns once.
+
+    Columns stored as plain NumPy arrays are compared on their raw bytes;
+    see _map_unique_columns.
+    """
+    import numpy as np
 
-    return calculate_unf(data, config)
+    arrays = [
+        series.to_numpy()
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufmM'
+        else None
+        for series in columns
+    ]
+    return _map_unique_columns(
+        partial(series_unf, config=config), columns, arrays, max_workers
+    )
 
 
-def dataframe_unf(df: "pd.DataFrame", config: UNFConfig | None = None) -> str:
+def dataframe_unf(
+    df: "pd.DataFrame",
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
+) -> str:
     """Calculate UNF for a pandas DataFrame.
 
     The UNF is calculated by computing individual UNFs for each column
@@ -57,6 +194,9 @@ def dataframe_unf(df: "pd.DataFrame", config: UNFConfig | None = None) -> str:
     Args:
         df: pandas DataFrame to calculate UNF for.
         config: Optional UNF configuration.
+        max_workers: If greater than 1, compute column UNFs in a pool of
+            this many worker processes. Worthwhile for wide, long frames;
+            the default computes them sequentially.
 
     Returns:
         Dataset-level UNF fingerprint string.
@@ -73,44 +213,42 @@ def dataframe_unf(df: "pd.DataFrame", config: UNFConfig | None = None) -> str:
         >>> print(unf)
         'UNF:6:...'
     """
-    try:
-        import pandas as pd
-    except ImportError:
-        raise ImportError(
-            "pandas is required for pandas_unf. "
-            "Install it with: pip install unf[pandas]"
-        )
+    pd = _ensure_pandas()
 
     if not isinstance(df, pd.DataFrame):
         raise TypeError(f"Expected pd.DataFrame, got {type(df)}")
 
     if df.empty:
-        from .unf import combine_unfs
         return combine_unfs([], config)
 
     # Calculate UNF for each column
-    column_unfs = []
-    for column in df.columns:
-        series = df[column]
-        unf = series_unf(series, config)
-        column_unfs.append(unf)
+    column_unfs = _column_unfs(
+        [df[column] for column in df.columns], config, max_workers
+    )
 
     # Combine column UNFs
-    from .unf import combine_unfs
     return combine_unfs(column_unfs, config)
 
 
 def dataframe_column_unfs(
     df: "pd.DataFrame",
-    config: UNFConfig | None = None
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
 ) -> dict[str, str]:
     """Calculate individual UNFs for each column in a DataFrame.
 
     Returns a dictionary mapping column names to their UNF fingerprints.
+    Columns holding byte-identical NumPy data are only hashed once. When
+    both the column UNFs and the dataset UNF are needed, combine the
+    column UNFs with combine_unfs instead of calling dataframe_unf, which
+    would hash every column a second time.
 
     Args:
         df: pandas DataFrame to calculate column UNFs for.
         config: Optional UNF configuration.
+        max_workers: If greater than 1, compute column UNFs in a pool of
+            this many worker processes. Worthwhile for wide, long frames;
+            the default computes them sequentially.
 
     Returns:
         Dictionary mapping column names to UNF strings.
@@ -125,19 +263,18 @@ def dataframe_column_unfs(
         >>> unfs = dataframe_column_unfs(df)
         >>> print(unfs)
         {'id': 'UNF:6:...', 'name': 'UNF:6:...'}
+        >>> combine_unfs(list(unfs.values())) == dataframe_unf(df)
+        True
     """
-    try:
-        import pandas as pd
-    except ImportError:
-        raise ImportError(
-            "pandas is required for pandas_unf. "
-            "Install it with: pip install unf[pandas]"
-        )
+    pd = _ensure_pandas()
 
     if not isinstance(df, pd.DataFrame):
         raise TypeError(f"Expected pd.DataFrame, got {type(df)}")
 
+    column_unfs = _column_unfs(
+        [df[column] for column in df.columns], config, max_workers
+    )
     return {
-        str(column): series_unf(df[column], config)
-        for column in df.columns
+        str(column): unf
+        for column, unf in zip(df.columns, column_unfs)
     }
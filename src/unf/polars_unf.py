@@ -14,14 +14,79 @@ This means polars data can be used directly without any NaN → None conversion
 "hack" needed for pandas data.
 """
 
-from typing import TYPE_CHECKING
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Iterable
 
-from .unf import calculate_unf, UNFConfig
+from .unf import calculate_unf, combine_unfs, UNFConfig, _fingerprint, _map_columns
 
 if TYPE_CHECKING:
+    import numpy as np
     import polars as pl
 
 
+@lru_cache(maxsize=1)
+def _ensure_polars():
+    """Ensure polars is available, and return the module.
+
+    The result is cached, so per-column calls skip the import machinery.
+    """
+    try:
+        import polars as pl
+        return pl
+    except ImportError:
+        raise ImportError(
+            "polars is required for polars_unf. "
+            "Install it with: pip install unf[polars]"
+        )
+
+
+def _numeric_values(series: "pl.Series") -> "np.ndarray | None":
+    """Extract a numeric or boolean Series as a NumPy array.
+
+    Nulls are returned as a masked array, so integers keep their exact
+    values instead of being cast to float. Returns None for other dtypes
+    (strings, dates, decimals, ...), which go through the generic path.
+    """
+    import numpy as np
+    import polars as pl
+
+    dtype = series.dtype
+    if not (dtype.is_integer() or dtype.is_float() or dtype == pl.Boolean):
+        return None
+
+    if series.null_count() == 0:
+        values = series.to_numpy()
+        return values if values.dtype.kind in 'biuf' else None
+
+    missing = series.is_null().to_numpy()
+    values = series.fill_null(strategy='zero').to_numpy()
+    if values.dtype.kind not in 'biuf':
+        return None
+    return np.ma.masked_array(values, mask=missing)
+
+
+def _string_stream(series: "pl.Series", config: UNFConfig) -> Iterable[bytes] | None:
+    """Build the normalized byte stream of a String Series from Arrow.
+
+    The Series' Arrow buffers are normalized with Arrow compute kernels,
+    without creating a Python string per value. Returns None if pyarrow
+    is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.types as pa_types
+    except ImportError:
+        return None
+    from .arrow_unf import _normalize_string_chunks
+
+    column = series.to_arrow()
+    if not (pa_types.is_string(column.type) or pa_types.is_large_string(column.type)):
+        column = column.cast(pa.large_string())
+    if not isinstance(column, pa.ChunkedArray):
+        column = pa.chunked_array([column])
+    return _normalize_string_chunks(column, config)
+
+
 def series_unf(series: "pl.Series", config: UNFConfig | None = None) -> str:
     """Calculate UNF for a polars Series.
 
@@ -56,25 +121,34 @@ def series_unf(series: "pl.Series", config: UNFConfig | None = None) -> str:
         preserved and encoded as NaN in the UNF calculation, which may not
         match other implementations that treat NaN as missing.
     """
-    try:
-        import polars as pl
-    except ImportError:
-        raise ImportError(
-            "polars is required for polars_unf. "
-            "Install it with: pip install unf[polars]"
-        )
+    pl = _ensure_polars()
 
     if not isinstance(series, pl.Series):
         raise TypeError(f"Expected pl.Series, got {type(series)}")
 
-    # Polars .to_list() automatically converts null to None
-    # This is superior to pandas which uses NaN
-    data = series.to_list()
+    # String columns are normalized straight from their Arrow buffers
+    if series.dtype == pl.String:
+        if config is None:
+            config = UNFConfig()
+        stream = _string_stream(series, config)
+        if stream is not None:
+            return _fingerprint(stream, config)
+
+    # Numeric and boolean columns are normalized in bulk from NumPy
+    data = _numeric_values(series)
+    if data is None:
+        # Polars .to_list() automatically converts null to None
+        # This is superior to pandas which uses NaN
+        data = series.to_list()
 
     return calculate_unf(data, config)
 
 
-def dataframe_unf(df: "pl.DataFrame", config: UNFConfig | None = None) -> str:
+def dataframe_unf(
+    df: "pl.DataFrame",
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
+) -> str:
     """Calculate UNF for a polars DataFrame.
 
     The UNF is calculated by computing individual UNFs for each column
@@ -84,6 +158,9 @@ def dataframe_unf(df: "pl.DataFrame", config: UNFConfig | None = None) -> str:
     Args:
         df: polars DataFrame to calculate UNF for.
         config: Optional UNF configuration.
+        max_workers: If greater than 1, compute column UNFs in a pool of
+            this many worker processes. Worthwhile for wide, long frames;
+            the default computes them sequentially.
 
     Returns:
         Dataset-level UNF fingerprint string.
@@ -109,36 +186,29 @@ def dataframe_unf(df: "pl.DataFrame", config: UNFConfig | None = None) -> str:
         >>> print(unf)
         'UNF:6:...'
     """
-    try:
-        import polars as pl
-    except ImportError:
-        raise ImportError(
-            "polars is required for polars_unf. "
-            "Install it with: pip install unf[polars]"
-        )
+    pl = _ensure_polars()
 
     if not isinstance(df, pl.DataFrame):
         raise TypeError(f"Expected pl.DataFrame, got {type(df)}")
 
     if df.is_empty():
-        from .unf import combine_unfs
         return combine_unfs([], config)
 
     # Calculate UNF for each column
-    column_unfs = []
-    for column in df.columns:
-        series = df[column]
-        unf = series_unf(series, config)
-        column_unfs.append(unf)
+    column_unfs = _map_columns(
+        partial(series_unf, config=config),
+        [df[column] for column in df.columns],
+        max_workers
+    )
 
     # Combine column UNFs
-    from .unf import combine_unfs
     return combine_unfs(column_unfs, config)
 
 
 def dataframe_column_unfs(
     df: "pl.DataFrame",
-    config: UNFConfig | None = None
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
 ) -> dict[str, str]:
     """Calculate individual UNFs for each column in a DataFrame.
 
@@ -147,6 +217,9 @@ def dataframe_column_unfs(
     Args:
         df: polars DataFrame to calculate column UNFs for.
         config: Optional UNF configuration.
+        max_workers: If greater than 1, compute column UNFs in a pool of
+            this many worker processes. Worthwhile for wide, long frames;
+            the default computes them sequentially.
 
     Returns:
         Dictionary mapping column names to UNF strings.
@@ -162,18 +235,17 @@ def dataframe_column_unfs(
         >>> print(unfs)
         {'id': 'UNF:6:...', 'name': 'UNF:6:...'}
     """
-    try:
-        import polars as pl
-    except ImportError:
-        raise ImportError(
-            "polars is required for polars_unf. "
-            "Install it with: pip install unf[polars]"
-        )
+    pl = _ensure_polars()
 
     if not isinstance(df, pl.DataFrame):
         raise TypeError(f"Expected pl.DataFrame, got {type(df)}")
 
+    column_unfs = _map_columns(
+        partial(series_unf, config=config),
+        [df[column] for column in df.columns],
+        max_workers
+    )
     return {
-        str(column): series_unf(df[column], config)
-        for column in df.columns
+        str(column): unf
+        for column, unf in zip(df.columns, column_unfs)
     }
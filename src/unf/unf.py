@@ -4,17 +4,46 @@ This module implements the main UNF fingerprint calculation and combination
 logic according to the UNF v6 specification.
 """
 
+import array
 import hashlib
-import base64
-from typing import Any, Sequence
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
 from .normalize import (
     normalize_numeric,
+    normalize_numeric_array,
     normalize_string,
+    normalize_string_array,
     normalize_boolean,
     normalize_date,
     normalize_datetime,
+    normalize_datetime_array,
 )
 
+# Number of normalized elements joined and hashed at a time. Normalized
+# values are typically 10-20 bytes, so a chunk is a few hundred kilobytes
+# and stays in L2 cache between being written and being hashed.
+_CHUNK_ELEMENTS = 16384
+
+# Missing values are encoded as three null bytes; every other value is
+# terminated with a newline and a null byte
+_MISSING = b'\000\000\000'
+_TERMINATOR = b'\n\000'
+
+# NumPy is optional; without it arrays go through the generic element loop
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# pybase64 is an optional, SIMD-accelerated drop-in for the stdlib encoder
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
 
 class UNFConfig:
     """Configuration for UNF calculation."""
@@ -53,23 +82,84 @@ class UNFConfig:
         Returns:
             Header string like "UNF:6:" or "UNF:6:N9,X256,H256:"
         """
-        parts = [f"UNF:{self.version}"]
+        return _header(
+            self.version, self.precision, self.max_chars, self.hash_bits, self.truncate
+        )
+
+
+# Shared default configuration for per-value calls without a config. It is
+# never handed out, so it cannot be modified by callers
+_DEFAULT_CONFIG = UNFConfig()
+
+
+@lru_cache(maxsize=None)
+def _header(
+    version: int,
+    precision: int,
+    max_chars: int,
+    hash_bits: int,
+    truncate: bool
+) -> str:
+    """Build the UNF header for a set of parameters.
+
+    Cached on the parameter values rather than on the config object, so a
+    config whose attributes are changed after construction still gets the
+    right header.
+    """
+    parts = [f"UNF:{version}"]
+
+    # Add non-default parameters
+    params = []
+    if precision != 7:
+        params.append(f"N{precision}")
+    if max_chars != 128:
+        params.append(f"X{max_chars}")
+    if hash_bits != 128:
+        params.append(f"H{hash_bits}")
+    if truncate:
+        params.append("R1")
+
+    if params:
+        parts.append(",".join(params))
 
-        # Add non-default parameters
-        params = []
-        if self.precision != 7:
-            params.append(f"N{self.precision}")
-        if self.max_chars != 128:
-            params.append(f"X{self.max_chars}")
-        if self.hash_bits != 128:
-            params.append(f"H{self.hash_bits}")
-        if self.truncate:
-            params.append("R1")
+    return ":".join(parts) + ":"
 
-        if params:
-            parts.append(",".join(params))
 
-        return ":".join(parts) + ":"
+def _normalize_number(value: int | float, config: UNFConfig) -> bytes:
+    return normalize_numeric(
+        value,
+        precision=config.precision,
+        round_mode=not config.truncate
+    ).encode()
+
+
+def _normalize_str(value: str, config: UNFConfig) -> bytes:
+    return normalize_string(value, max_chars=config.max_chars)
+
+
+def _normalize_bool(value: bool, config: UNFConfig) -> bytes:
+    return normalize_boolean(value).encode()
+
+
+def _normalize_datetime(value: datetime, config: UNFConfig) -> bytes:
+    return normalize_datetime(value).encode()
+
+
+def _normalize_date(value: date, config: UNFConfig) -> bytes:
+    return normalize_date(value).encode()
+
+
+# Normalizers for the built-in types, looked up on the exact type of a value.
+# Order matters for the isinstance fallback: bool is a subclass of int, and
+# datetime of date, so the more specific type comes first
+_NORMALIZERS: dict[type, Callable[[Any, UNFConfig], bytes]] = {
+    bool: _normalize_bool,
+    int: _normalize_number,
+    float: _normalize_number,
+    str: _normalize_str,
+    datetime: _normalize_datetime,
+    date: _normalize_date,
+}
 
 
 def normalize_value(
@@ -86,43 +176,302 @@ def normalize_value(
         Normalized value as bytes.
     """
     if config is None:
-        config = UNFConfig()
+        config = _DEFAULT_CONFIG
 
     # Handle None/missing values
     if value is None:
-        return b'\000\000\000'
-
-    # Numeric types
-    if isinstance(value, (int, float)):
-        normalized = normalize_numeric(
-            value,
-            precision=config.precision,
-            round_mode=not config.truncate
-        )
-        return normalized.encode('utf-8')
+        return _MISSING
 
-    # String type
-    if isinstance(value, str):
-        return normalize_string(value, max_chars=config.max_chars)
+    # Built-in types dispatch in a single lookup
+    normalizer = _NORMALIZERS.get(type(value))
+    if normalizer is not None:
+        return normalizer(value, config)
 
-    # Boolean type
-    if isinstance(value, bool):
-        normalized = normalize_boolean(value)
-        return normalized.encode('utf-8')
+    # Subclasses (NumPy floats, pandas Timestamps, ...) of the same types
+    for base, normalizer in _NORMALIZERS.items():
+        if isinstance(value, base):
+            return normalizer(value, config)
 
-    # Date/datetime types
-    from datetime import date, datetime
+    # Default: convert to string
+    return str(value).encode()
 
-    if isinstance(value, datetime):
-        normalized = normalize_datetime(value)
-        return normalized.encode('utf-8')
 
-    if isinstance(value, date):
-        normalized = normalize_date(value)
-        return normalized.encode('utf-8')
+def _fingerprint(stream: bytes | Iterable[bytes], config: UNFConfig) -> str:
+    """Hash a normalized byte stream and format it as a UNF.
 
-    # Default: convert to string
-    return str(value).encode('utf-8')
+    The stream is either a single bytes object or an iterable of chunks.
+    Chunks are fed to one SHA256 object as they are produced, so a large
+    column never has to be held as one concatenated buffer.
+    """
+    # Compute SHA256 hash
+    if isinstance(stream, bytes):
+        hash_obj = hashlib.sha256(stream)
+    else:
+        hash_obj = hashlib.sha256()
+        for chunk in stream:
+            hash_obj.update(chunk)
+    return _format_unf(hash_obj.digest(), config)
+
+
+def _format_unf(hash_bytes: bytes, config: UNFConfig) -> str:
+    """Truncate a SHA256 digest and format it as a UNF."""
+    # Truncate to specified number of bits
+    num_bytes = config.hash_bits // 8
+    truncated_hash = hash_bytes[:num_bytes]
+
+    # Encode in base64
+    b64_hash = _b64encode(truncated_hash).decode('ascii')
+
+    # Return with header
+    return config.get_header() + b64_hash
+
+
+def _join_chunks(elements: Sequence[bytes]) -> Iterator[bytes]:
+    """Join normalized elements into chunks of _CHUNK_ELEMENTS elements.
+
+    Each chunk is small enough to stay in cache while it is hashed.
+    """
+    for start in range(0, len(elements), _CHUNK_ELEMENTS):
+        yield b''.join(elements[start:start + _CHUNK_ELEMENTS])
+
+
+def _map_columns(
+    func: Callable[[Any], str],
+    columns: Sequence[Any],
+    max_workers: int | None = None
+) -> list[str]:
+    """Apply func to every column, optionally in a process pool.
+
+    Column UNFs are independent of each other, so with max_workers > 1
+    they are computed in worker processes. In that case func and the
+    columns must be picklable. Results are returned in column order.
+
+    Workers are started with forkserver (or spawn where that is not
+    available) rather than fork, which is unsafe once pandas, pyarrow or
+    polars have started their own threads.
+    """
+    if max_workers is None or max_workers < 2 or len(columns) < 2:
+        return [func(column) for column in columns]
+
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+    else:
+        context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(columns)),
+        mp_context=context
+    ) as executor:
+        return list(executor.map(func, columns))
+
+
+def _map_unique_columns(
+    func: Callable[[Any], str],
+    columns: Sequence[Any],
+    arrays: Sequence["np.ndarray | None"],
+    max_workers: int | None = None
+) -> list[str]:
+    """Apply func to every column like _map_columns, once per identical column.
+
+    arrays holds the plain NumPy data of each column, or None for columns
+    that are not compared. Columns are compared on their raw bytes, first
+    on a cheap key of dtype, length and the first and last few kilobytes,
+    then in full. Only byte-identical columns share a result, so -0.0 and
+    0.0, for example, are never conflated.
+    """
+    unique: list[Any] = []
+    positions: list[int] = []
+    candidates: dict[tuple, list[tuple[int, "np.ndarray"]]] = {}
+    for column, array in zip(columns, arrays):
+        if array is None:
+            positions.append(len(unique))
+            unique.append(column)
+            continue
+
+        raw = np.ascontiguousarray(array).view(np.uint8)
+        key = (array.dtype.str, len(raw), raw[:4096].tobytes(), raw[-4096:].tobytes())
+        for index, other in candidates.get(key, []):
+            if np.array_equal(raw, other):
+                positions.append(index)
+                break
+        else:
+            candidates.setdefault(key, []).append((len(unique), raw))
+            positions.append(len(unique))
+            unique.append(column)
+
+    unique_results = _map_columns(func, unique, max_workers)
+    return [unique_results[index] for index in positions]
+
+
+def _plain_array(data: Any) -> "np.ndarray | None":
+    """Return data if it is a plain (unmasked) 1-D NumPy numeric or datetime array."""
+    if (
+        np is not None
+        and type(data) is np.ndarray
+        and data.ndim == 1
+        and data.dtype.kind in 'biufmM'
+    ):
+        return data
+    return None
+
+
+def _is_numeric_array(data: Any) -> bool:
+    """Check whether data is a one-dimensional NumPy numeric or boolean array."""
+    return (
+        np is not None
+        and isinstance(data, np.ndarray)
+        and data.ndim == 1
+        and data.dtype.kind in 'biuf'
+    )
+
+
+def _normalize_numeric_array(
+    data: "np.ndarray",
+    config: UNFConfig
+) -> Iterator[bytes]:
+    """Build the normalized byte stream for a NumPy numeric or boolean array.
+
+    Masked entries (for ``numpy.ma`` arrays) and NaN are missing values.
+    Every distinct value is normalized only once. The terminated bytes are
+    then gathered back into place one chunk at a time, so the stream is
+    produced in cache-sized pieces rather than as one large buffer.
+    """
+    missing = np.ma.getmaskarray(data)
+    values = np.ma.getdata(data)
+
+    if values.dtype.kind == 'f':
+        values = values.astype(np.float64, copy=False)
+        missing = missing | np.isnan(values)
+        # Deduplicate on the bit patterns so that -0.0 stays distinct from +0.0
+        keys = values.view(np.uint64)
+    else:
+        keys = values
+
+    present = ~missing
+    unique_keys, inverse = np.unique(keys[present], return_inverse=True)
+    if values.dtype.kind == 'f':
+        unique_keys = unique_keys.view(np.float64)
+
+    normalized = normalize_numeric_array(
+        unique_keys,
+        precision=config.precision,
+        round_mode=not config.truncate
+    )
+    return _gather_chunks(normalized, present, inverse)
+
+
+def _normalize_datetime_array(
+    data: "np.ndarray",
+    config: UNFConfig
+) -> Iterator[bytes]:
+    """Build the normalized byte stream for a naive NumPy datetime64 array.
+
+    NaT entries are missing values. As for numeric arrays, every distinct
+    timestamp is formatted only once.
+    """
+    present = ~np.isnat(data)
+    unique_values, inverse = np.unique(data[present], return_inverse=True)
+    return _gather_chunks(normalize_datetime_array(unique_values), present, inverse)
+
+
+def _gather_chunks(
+    normalized: Sequence[str],
+    present: "np.ndarray",
+    inverse: "np.ndarray"
+) -> Iterator[bytes]:
+    """Gather normalized unique values back into place, chunk by chunk.
+
+    Args:
+        normalized: Normalized form of each distinct value.
+        present: Boolean mask of the non-missing elements.
+        inverse: Index into normalized for each non-missing element.
+    """
+    # The last entry of the lookup table is the missing value token.
+    # str.encode() without arguments is UTF-8, without a codec lookup
+    table = np.empty(len(normalized) + 1, dtype=object)
+    table[:-1] = [value.encode() + _TERMINATOR for value in normalized]
+    table[-1] = _MISSING
+
+    codes = np.full(len(present), len(normalized), dtype=np.intp)
+    codes[present] = inverse
+
+    for start in range(0, len(codes), _CHUNK_ELEMENTS):
+        yield b''.join(table[codes[start:start + _CHUNK_ELEMENTS]].tolist())
+
+
+def _normalize_codes(
+    values: Sequence[Any],
+    codes: "np.ndarray",
+    config: UNFConfig
+) -> Iterator[bytes]:
+    """Build the normalized byte stream of a dictionary-encoded vector.
+
+    Each dictionary value is normalized once, and the elements are then
+    gathered from the resulting lookup table, chunk by chunk.
+
+    Args:
+        values: The dictionary of distinct values.
+        codes: Index into values for each element; -1 marks a missing element.
+        config: UNF configuration.
+    """
+    # The last entry of the lookup table, which code -1 selects, is the
+    # missing value token
+    table = np.empty(len(values) + 1, dtype=object)
+    table[:-1] = _normalize_elements(values, config)
+    table[-1] = _MISSING
+
+    for start in range(0, len(codes), _CHUNK_ELEMENTS):
+        yield b''.join(table[codes[start:start + _CHUNK_ELEMENTS]].tolist())
+
+
+def _normalize_elements(data: Sequence[Any], config: UNFConfig) -> list[bytes]:
+    """Normalize and terminate each element of a mixed-type vector.
+
+    Elements are bucketed by exact type in a single pass, so floats, ints
+    and strings are each normalized in one homogeneous batch, and the
+    results are scattered back to their original positions. Anything else
+    (booleans, dates, NumPy scalars, ...) goes through normalize_value.
+    NaN floats are treated as missing, as pandas and NumPy use NaN for
+    missing values but UNF requires them to be encoded as None.
+    """
+    if not hasattr(data, '__len__'):
+        data = list(data)
+
+    # Non-missing values get terminated with newline + null byte as they
+    # are written, so no second pass over the output is needed
+    missing = _MISSING
+    terminator = _TERMINATOR
+    elements = [missing] * len(data)
+    floats: tuple[list[int], list[float]] = ([], [])
+    ints: tuple[list[int], list[int]] = ([], [])
+    strings: tuple[list[int], list[str]] = ([], [])
+    buckets = {float: floats, int: ints, str: strings}
+
+    for position, value in enumerate(data):
+        # NaN is the only float that compares unequal to itself
+        if isinstance(value, float) and value != value:
+            continue
+        bucket = buckets.get(type(value))
+        if bucket is not None:
+            bucket[0].append(position)
+            bucket[1].append(value)
+        elif value is not None:
+            element = normalize_value(value, config)
+            if element != missing:
+                elements[position] = element + terminator
+
+    round_mode = not config.truncate
+    for positions, values in (floats, ints):
+        normalized = normalize_numeric_array(values, config.precision, round_mode)
+        for position, value in zip(positions, normalized):
+            elements[position] = value.encode() + terminator
+    for position, value in zip(
+        strings[0], normalize_string_array(strings[1], config.max_chars)
+    ):
+        if value != missing:
+            elements[position] = value + terminator
+
+    return elements
 
 
 def calculate_unf(
@@ -132,7 +481,11 @@ def calculate_unf(
     """Calculate the UNF fingerprint for a vector of data.
 
     Args:
-        data: Sequence of values (a single variable/column).
+        data: Sequence of values (a single variable/column). One-dimensional
+            NumPy numeric or boolean arrays, numeric buffers (memoryview),
+            and array-likes such as pandas Series with a NumPy numeric
+            dtype, are normalized in bulk; NaN and masked entries
+            (``numpy.ma``) are treated as missing.
         config: UNF configuration (uses defaults if None).
 
     Returns:
@@ -145,55 +498,42 @@ def calculate_unf(
         'UNF:6:...'
 
     Note:
-        When using with pandas DataFrames, NaN values should be converted to None
-        first for correct missing value handling. See calculate_unf_pandas() for
-        a convenience function that handles this automatically.
+        Float NaN values are treated as missing, so pandas columns can be
+        passed as NumPy arrays (``series.to_numpy()``). See series_unf() for
+        a convenience function that also handles pd.NA and datetimes.
     """
     if config is None:
         config = UNFConfig()
 
-    # Convert NaN to None for proper missing value handling
-    # This is necessary because pandas and other libraries use NaN (float('nan'))
-    # for missing values, but UNF requires missing values to be encoded as None
-    cleaned_data = []
-    for value in data:
-        # Check if value is NaN (works for numpy, pandas, and regular floats)
-        if isinstance(value, float):
-            import math
-            if math.isnan(value):
-                cleaned_data.append(None)
-            else:
-                cleaned_data.append(value)
-        else:
-            cleaned_data.append(value)
-
-    # Normalize each element
-    normalized_elements = []
-    for value in cleaned_data:
-        norm_value = normalize_value(value, config)
-
-        # Non-missing values get terminated with newline + null byte
-        if norm_value != b'\000\000\000':
-            normalized_elements.append(norm_value + b'\n\000')
-        else:
-            normalized_elements.append(norm_value)
+    return _fingerprint(_normalize_stream(data, config), config)
+
+
+def _normalize_stream(data: Sequence[Any], config: UNFConfig) -> Iterable[bytes]:
+    """Build the normalized byte stream of a vector, in hashable chunks."""
+    # An empty vector hashes the empty stream; skip the normalization setup
+    if hasattr(data, '__len__') and len(data) == 0:
+        return b''
+
+    # Buffers (memoryview, array.array, ...) and array-likes backed by a
+    # NumPy numeric dtype (such as pandas Series) are normalized in bulk
+    # from their array, without boxing every value
+    if np is not None and not isinstance(data, np.ndarray):
+        dtype = getattr(data, 'dtype', None)
+        if (
+            isinstance(data, (memoryview, array.array))
+            or hasattr(data, '__array_interface__')
+            or (isinstance(dtype, np.dtype) and dtype.kind in 'biuf')
+        ):
+            values = np.asarray(data)
+            if _is_numeric_array(values):
+                data = values
+
+    # Numeric and boolean arrays are normalized in bulk
+    if _is_numeric_array(data):
+        return _normalize_numeric_array(data, config)
 
     # Concatenate all normalized strings
-    concatenated = b''.join(normalized_elements)
-
-    # Compute SHA256 hash
-    hash_obj = hashlib.sha256(concatenated)
-    hash_bytes = hash_obj.digest()
-
-    # Truncate to specified number of bits
-    num_bytes = config.hash_bits // 8
-    truncated_hash = hash_bytes[:num_bytes]
-
-    # Encode in base64
-    b64_hash = base64.b64encode(truncated_hash).decode('ascii')
-
-    # Return with header
-    return config.get_header() + b64_hash
+    return _join_chunks(_normalize_elements(data, config))
 
 
 def combine_unfs(
@@ -225,37 +565,21 @@ def combine_unfs(
     if not unfs:
         return config.get_header()
 
-    # Sort UNFs in POSIX locale order (byte-wise sorting)
-    sorted_unfs = sorted(unfs)
+    # Sort UNFs in POSIX locale order (byte-wise sorting of the UTF-8
+    # encodings, which is also code point order)
+    sorted_unfs = sorted(unf.encode('utf-8') for unf in unfs)
 
-    # Treat the sorted UNFs as a vector and calculate UNF
-    # Each UNF is treated as a string value
-    normalized_elements = []
-    for unf in sorted_unfs:
-        # Encode as UTF-8, terminate with newline + null
-        normalized_elements.append(unf.encode('utf-8') + b'\n\000')
+    # Treat the sorted UNFs as a vector of string values, each terminated
+    # with newline + null
+    concatenated = b''.join(unf + _TERMINATOR for unf in sorted_unfs)
 
-    # Concatenate
-    concatenated = b''.join(normalized_elements)
-
-    # Compute SHA256 hash
-    hash_obj = hashlib.sha256(concatenated)
-    hash_bytes = hash_obj.digest()
-
-    # Truncate to specified number of bits
-    num_bytes = config.hash_bits // 8
-    truncated_hash = hash_bytes[:num_bytes]
-
-    # Encode in base64
-    b64_hash = base64.b64encode(truncated_hash).decode('ascii')
-
-    # Return with header
-    return config.get_header() + b64_hash
+    return _fingerprint(concatenated, config)
 
 
 def calculate_dataset_unf(
-    data: Sequence[Sequence[Any]],
-    config: UNFConfig | None = None
+    data: Sequence[Sequence[Any]] | Mapping[Any, Sequence[Any]],
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
 ) -> str:
     """Calculate UNF for a complete dataset (multiple variables).
 
@@ -263,8 +587,11 @@ def calculate_dataset_unf(
     variable and then combines them.
 
     Args:
-        data: Sequence of variables (columns), where each variable is a sequence of values.
+        data: Sequence of variables (columns), where each variable is a sequence of values,
+            or a mapping from variable names to variables.
         config: UNF configuration (uses defaults if None).
+        max_workers: If greater than 1, compute variable UNFs in a pool of
+            this many worker processes; the variables must be picklable.
 
     Returns:
         Dataset-level UNF fingerprint string.
@@ -277,8 +604,17 @@ def calculate_dataset_unf(
     if config is None:
         config = UNFConfig()
 
-    # Calculate UNF for each variable
-    variable_unfs = [calculate_unf(variable, config) for variable in data]
+    # Collect the variables, which are read twice below
+    data = list(data.values()) if isinstance(data, Mapping) else list(data)
+
+    # Calculate UNF for each variable; identical NumPy columns are hashed
+    # only once
+    variable_unfs = _map_unique_columns(
+        partial(calculate_unf, config=config),
+        data,
+        [_plain_array(variable) for variable in data],
+        max_workers
+    )
 
     # Combine them
     return combine_unfs(variable_unfs, config)
@@ -286,7 +622,8 @@ def calculate_dataset_unf(
 
 def calculate_unf_from_stata(
     filepath: str,
-    config: UNFConfig | None = None
+    config: UNFConfig | None = None,
+    max_workers: int | None = None
 ) -> dict[str, str]:
     """Calculate UNFs for all variables in a Stata file.
 
@@ -298,6 +635,9 @@ def calculate_unf_from_stata(
     Args:
         filepath: Path to the Stata (.dta) file.
         config: UNF configuration (uses defaults if None).
+        max_workers: If greater than 1, compute variable UNFs in a pool of
+            this many worker processes. Worthwhile for files with many long
+            variables; the default computes them sequentially.
 
     Returns:
         Dictionary mapping variable names to their UNF fingerprints, plus a
@@ -325,18 +665,55 @@ def calculate_unf_from_stata(
     if config is None:
         config = UNFConfig()
 
-    # Read Stata file without converting value labels to strings
-    # This matches R's haven behavior where labeled variables retain numeric codes
-    df, meta = pyreadstat.read_dta(filepath, apply_value_formats=False)
+    from ._stata_fast import read_layout, read_numeric_column
+
+    # Plain numeric columns are hashed straight from a memory map of the
+    # file; pyreadstat only has to read the remaining columns
+    layout = read_layout(filepath)
+    direct_columns = {}
+    if layout is not None and layout.nobs > 0:
+        direct_columns = {
+            name: index for index, name in enumerate(layout.names)
+            if layout.is_plain_numeric(index)
+        }
+
+    if direct_columns:
+        names = layout.names
+        other_columns = [name for name in names if name not in direct_columns]
+    else:
+        names = None
+        other_columns = None
+
+    if other_columns is None or other_columns:
+        # Read Stata file without converting value labels to strings
+        # This matches R's haven behavior where labeled variables retain numeric codes
+        df, meta = pyreadstat.read_dta(
+            filepath,
+            apply_value_formats=False,
+            usecols=other_columns
+        )
+        if names is None:
+            names = list(df.columns)
+
+    # Collect the values of each variable
+    columns = []
+    for column in names:
+        if column in direct_columns:
+            columns.append(read_numeric_column(layout, filepath, direct_columns[column]))
+        elif df[column].dtype.kind in 'biuf':
+            # Labelled numeric variables are passed on as NumPy arrays,
+            # without boxing every value
+            columns.append(df[column].to_numpy())
+        else:
+            columns.append(df[column].tolist())
 
     # Calculate UNF for each variable
-    variable_unfs = {}
-    for column in df.columns:
-        # NaN values are automatically handled by calculate_unf
-        variable_unfs[column] = calculate_unf(df[column].tolist(), config)
-
-    # Calculate dataset-level UNF
-    all_variable_data = [df[col].tolist() for col in df.columns]
-    variable_unfs['__dataset__'] = calculate_dataset_unf(all_variable_data, config)
+    # NaN values are automatically handled by calculate_unf
+    variable_unfs = dict(zip(
+        names, _map_columns(partial(calculate_unf, config=config), columns, max_workers)
+    ))
+
+    # Calculate dataset-level UNF from the variable UNFs
+    variable_unfs['__dataset__'] = combine_unfs(list(variable_unfs.values()), config)
 
     return variable_unfs
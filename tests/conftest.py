@@ -0,0 +1,22 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+from unf import calculate_unf_from_stata
+
+
+@pytest.fixture(scope="session")
+def stata_unfs():
+    """Calculate UNFs for the test Stata file, once per test session."""
+    return calculate_unf_from_stata("tests/mmtalent_df.dta")
+
+
+@pytest.fixture(scope="session")
+def mmtalent_columns():
+    """Read the test Stata file as a dict of column lists, once per test session."""
+    pyreadstat = pytest.importorskip("pyreadstat")
+    columns, meta = pyreadstat.read_dta(
+        "tests/mmtalent_df.dta",
+        apply_value_formats=False,
+        output_format="dict"
+    )
+    return columns
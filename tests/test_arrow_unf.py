@@ -0,0 +1,31 @@
+"""Tests for hashing columns straight from Arrow arrays."""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from unf import calculate_unf
+from unf.arrow_unf import _arrow_column_unf
+from unf.unf import UNFConfig
+
+
+class TestArrowColumnUNF:
+    """Tests for _arrow_column_unf."""
+
+    def test_string_column_matches_list(self):
+        values = ["héllo", None, "\x00\x00\x00", "", "日本語" * 60]
+        column = pa.chunked_array([values[:2], values[2:]])
+        assert _arrow_column_unf([column]) == calculate_unf(values)
+
+    def test_large_string_column_truncation(self):
+        values = ["abcdef", None, "\x00\x00\x00xyz"]
+        column = pa.chunked_array([values], type=pa.large_string())
+        config = UNFConfig(max_chars=3)
+        assert _arrow_column_unf([column], config) == calculate_unf(values, config)
+
+    def test_numeric_batches_match_list(self):
+        batches = [pa.chunked_array([[1.5, None]]), pa.chunked_array([[-0.0, 4.25]])]
+        assert _arrow_column_unf(batches) == calculate_unf([1.5, None, -0.0, 4.25])
+
+    def test_integer_column_with_nulls_not_streamable(self):
+        assert _arrow_column_unf([pa.chunked_array([[1, None]])]) is None
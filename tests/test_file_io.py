@@ -26,8 +26,9 @@ if PANDAS_AVAILABLE:
         stata_unf,
         json_unf,
         excel_unf,
+        feather_unf,
     )
-    from unf import dataframe_unf
+    from unf import dataframe_unf, files_unf, files_unf_async
 
 
 @pytest.fixture
@@ -71,6 +72,56 @@ class TestCSVUnf:
         unf = csv_unf(tsv_path, sep="\t")
         assert unf.startswith("UNF:6:")
 
+    def test_csv_chunksize(self, sample_dataframe, temp_dir):
+        """Test that hashing a CSV in chunks gives the full-read UNF."""
+        csv_path = temp_dir / "test.csv"
+        sample_dataframe.to_csv(csv_path, index=False)
+
+        result = csv_unf(csv_path, chunksize=2, return_metadata=True)
+        assert result['unf'] == csv_unf(csv_path)
+        assert result['shape'] == sample_dataframe.shape
+
+    def test_csv_chunksize_type_change(self, temp_dir):
+        """Test that a column typed differently in a later chunk is reread."""
+        csv_path = temp_dir / "test.csv"
+        csv_path.write_text("a,b\n1,x\n2,y\n,z\n")
+
+        assert csv_unf(csv_path, chunksize=2) == csv_unf(csv_path)
+
+    def test_csv_chunksize_type_change_buffer(self, temp_dir):
+        """Test that a buffer is rewound when a later chunk changes type."""
+        import io
+
+        text = "a,b\n1,x\n2,y\n,z\n"
+        csv_path = temp_dir / "test.csv"
+        csv_path.write_text(text)
+
+        assert csv_unf(io.StringIO(text), chunksize=2) == csv_unf(csv_path)
+
+    def test_csv_streamed_above_threshold(self, sample_dataframe, temp_dir, monkeypatch):
+        """Test that large files are streamed with the same UNF."""
+        import unf.file_io
+
+        csv_path = temp_dir / "test.csv"
+        sample_dataframe.to_csv(csv_path, index=False)
+        expected = csv_unf(csv_path, return_metadata=True)
+
+        monkeypatch.setattr(unf.file_io, 'STREAMING_THRESHOLD', 1)
+        monkeypatch.setattr(unf.file_io, '_CSV_CHUNK_ROWS', 2)
+        assert csv_unf(csv_path, return_metadata=True) == expected
+
+    def test_csv_pyarrow_engine(self, sample_dataframe, temp_dir):
+        """Test that the pyarrow parser gives the same UNF for plain data."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+
+        csv_path = temp_dir / "test.csv"
+        sample_dataframe.to_csv(csv_path, index=False)
+
+        assert csv_unf(csv_path, engine="pyarrow") == csv_unf(csv_path)
+
     def test_csv_with_metadata(self, sample_dataframe, temp_dir):
         """Test CSV UNF with metadata."""
         csv_path = temp_dir / "test.csv"
@@ -121,6 +172,109 @@ class TestParquetUnf:
         assert result['format'] == 'parquet'
         assert result['shape'] == (5, 4)
 
+    def test_parquet_index_and_row_groups(self, sample_dataframe, temp_dir):
+        """Test that index columns are excluded when reading column by column."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+
+        parquet_path = temp_dir / "test.parquet"
+        sample_dataframe.set_index('id').to_parquet(parquet_path, row_group_size=2)
+
+        result = parquet_unf(parquet_path, return_metadata=True)
+        assert result['columns'] == ['name', 'age', 'score']
+        assert result['shape'] == (5, 3)
+        assert result['unf'] == dataframe_unf(sample_dataframe.set_index('id'))
+
+    def test_parquet_numeric_columns_across_row_groups(self, temp_dir):
+        """Test that numeric columns hashed by row group match the DataFrame."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+
+        df = pd.DataFrame({
+            'x': [1.5, None, 3.25, 4.0, None, 6.125, 7.0],
+            'n': [1, 2, 3, 4, 5, 6, 7],
+            'flag': [True, False, True, True, False, True, False]
+        })
+        parquet_path = temp_dir / "test.parquet"
+        df.to_parquet(parquet_path, index=False, row_group_size=3)
+
+        assert parquet_unf(parquet_path) == dataframe_unf(df)
+
+    def test_parquet_batches_within_row_groups(self, temp_dir, monkeypatch):
+        """Test that columns streamed in batches match the DataFrame UNF."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+        import unf.file_io
+
+        monkeypatch.setattr(unf.file_io, '_PARQUET_BATCH_ROWS', 2)
+        df = pd.DataFrame({
+            'x': [1.5, None, 3.25, 4.0, None],
+            's': ['a', None, 'ccc', '', 'e']
+        })
+        parquet_path = temp_dir / "test.parquet"
+        df.to_parquet(parquet_path, index=False)
+
+        assert parquet_unf(parquet_path) == dataframe_unf(df)
+
+    def test_parquet_columns(self, sample_dataframe, temp_dir):
+        """Test that a column selection gives the UNF of those columns."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+
+        parquet_path = temp_dir / "test.parquet"
+        sample_dataframe.to_parquet(parquet_path, index=False)
+
+        result = parquet_unf(parquet_path, columns=['score', 'name'], return_metadata=True)
+        assert result['columns'] == ['score', 'name']
+        assert result['unf'] == dataframe_unf(sample_dataframe[['name', 'score']])
+        assert file_unf(parquet_path, columns=['name', 'score']) == result['unf']
+
+
+class TestFeatherUnf:
+    """Tests for Feather file UNF calculation."""
+
+    def test_feather_basic(self, sample_dataframe, temp_dir):
+        """Test that Feather UNF matches the DataFrame UNF."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+
+        feather_path = temp_dir / "test.feather"
+        sample_dataframe.assign(missing=[1.5, None, 2.5, None, 3.5]).to_feather(feather_path)
+
+        result = feather_unf(feather_path, return_metadata=True)
+        assert result['format'] == 'feather'
+        assert result['shape'] == (5, 5)
+        assert result['unf'] == dataframe_unf(
+            sample_dataframe.assign(missing=[1.5, None, 2.5, None, 3.5])
+        )
+
+    def test_feather_empty_column_selection(self, sample_dataframe, temp_dir):
+        """Test that an empty column selection hashes no columns, as for Parquet."""
+        try:
+            import pyarrow
+        except ImportError:
+            pytest.skip("pyarrow not installed")
+
+        feather_path = temp_dir / "test.feather"
+        sample_dataframe.to_feather(feather_path)
+        parquet_path = temp_dir / "test.parquet"
+        sample_dataframe.to_parquet(parquet_path, index=False)
+
+        result = feather_unf(feather_path, columns=[], return_metadata=True)
+        assert result['columns'] == []
+        assert result['unf'] == parquet_unf(parquet_path, columns=[])
+        assert feather_unf(feather_path, columns=[], use_threads=False) == result['unf']
+
 
 class TestStataUnf:
     """Tests for Stata file UNF calculation."""
@@ -143,6 +297,26 @@ class TestStataUnf:
         assert result['format'] == 'stata'
         assert result['shape'] == (5, 4)
 
+    def test_stata_missing_values_all_versions(self, temp_dir):
+        """Test that directly read numeric columns match pd.read_stata."""
+        df = pd.DataFrame({
+            'small': np.array([1, -5, 100, 7], dtype=np.int8),
+            'single': np.array([1.1, np.nan, 1e30, 2.5], dtype=np.float32),
+            'large': [1.5, np.nan, 8.98e307, -0.0],
+            'name': ['a', 'bb', None, 'd'],
+            'when': pd.to_datetime(['2020-01-01', '2021-05-06', '1960-01-01', '2000-02-29']),
+        })
+        for version in (114, 117, 118, 119):
+            for byteorder in ('<', '>'):
+                dta_path = temp_dir / f"test_{version}.dta"
+                df.to_stata(dta_path, write_index=False, version=version, byteorder=byteorder)
+
+                expected = dataframe_unf(pd.read_stata(dta_path))
+                result = stata_unf(dta_path, return_metadata=True)
+                assert result['unf'] == expected
+                assert result['columns'] == list(df.columns)
+                assert result['shape'] == (4, 5)
+
 
 class TestJSONUnf:
     """Tests for JSON file UNF calculation."""
@@ -283,6 +457,51 @@ class TestFileUnfAutoDetect:
         with pytest.raises(ValueError, match="Unsupported format"):
             file_unf(csv_path, format="unsupported")
 
+    def test_registered_format(self, sample_dataframe, temp_dir, monkeypatch):
+        """Test that file_unf dispatches through FORMAT_READERS."""
+        from unf.file_io import FORMAT_READERS
+
+        monkeypatch.setitem(FORMAT_READERS, 'custom', csv_unf)
+        csv_path = temp_dir / "test.csv"
+        sample_dataframe.to_csv(csv_path, index=False)
+
+        assert file_unf(csv_path, format="custom") == csv_unf(csv_path)
+
+
+class TestFilesUnf:
+    """Tests for calculating UNFs of several files at once."""
+
+    def test_files_unf_matches_file_unf(self, sample_dataframe, temp_dir):
+        """Test that concurrent results match file_unf for each file."""
+        csv_path = temp_dir / "test.csv"
+        json_path = temp_dir / "test.json"
+        dta_path = temp_dir / "test.dta"
+        sample_dataframe.to_csv(csv_path, index=False)
+        sample_dataframe.to_json(json_path, orient='records')
+        sample_dataframe.to_stata(dta_path, write_index=False)
+
+        paths = [csv_path, json_path, dta_path]
+        result = files_unf(paths)
+        assert list(result) == [str(path) for path in paths]
+        for path in paths:
+            assert result[str(path)] == file_unf(path)
+
+    def test_files_unf_async_matches_files_unf(self, sample_dataframe, temp_dir):
+        """Test that the asyncio variant gives the same UNFs."""
+        import asyncio
+
+        paths = []
+        for i in range(3):
+            path = temp_dir / f"test{i}.csv"
+            sample_dataframe.iloc[i:].to_csv(path, index=False)
+            paths.append(path)
+
+        unfs = asyncio.run(files_unf_async(paths, max_concurrency=2))
+        assert unfs == files_unf(paths)
+
+    def test_files_unf_empty(self):
+        assert files_unf([]) == {}
+
 
 class TestFormatConsistency:
     """Test that UNF is consistent across formats."""
@@ -1,14 +1,17 @@
 """Tests for normalization functions."""
 
 import math
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta, timezone
 import pytest
 from unf.normalize import (
     normalize_numeric,
     normalize_string,
+    normalize_string_array,
+    normalize_string_bytes,
     normalize_boolean,
     normalize_date,
     normalize_datetime,
+    normalize_datetime_array,
     normalize_time,
     normalize_bitfield,
 )
@@ -40,6 +43,14 @@ class TestNormalizeNumeric:
         assert result.startswith('+3.')
         assert 'e+' in result
 
+    def test_integral_values(self):
+        assert normalize_numeric(1200) == '+1.2e+03'
+        assert normalize_numeric(-7.0) == '-7.e+'
+        assert normalize_numeric(9999999.0) == '+9.999999e+06'
+        # Integers longer than the precision are still rounded
+        assert normalize_numeric(12345678) == '+1.234568e+07'
+        assert normalize_numeric(12345678, round_mode=False) == '+1.234567e+07'
+
     def test_positive_float(self):
         result = normalize_numeric(3.1415)
         assert result.startswith('+3.1415')
@@ -96,6 +107,19 @@ class TestNormalizeString:
         result = normalize_string("")
         assert result == b''
 
+    def test_array_matches_scalar(self):
+        values = ["hello", "héllo", None, "", "é" * 200]
+        expected = [normalize_string(v, max_chars=5) for v in values]
+        assert normalize_string_array(values, max_chars=5) == expected
+
+    def test_bytes_match_string(self):
+        values = ["hello", "héllo", "", "x" * 200, "é" * 200, "日本語" * 60]
+        for value in values:
+            for max_chars in (1, 5, 128):
+                assert normalize_string_bytes(value.encode('utf-8'), max_chars) == \
+                    normalize_string(value, max_chars)
+        assert normalize_string_bytes(None) == b'\x00\x00\x00'
+
 
 class TestNormalizeBoolean:
     """Tests for boolean normalization."""
@@ -162,10 +186,46 @@ class TestNormalizeDatetime:
         result = normalize_datetime(dt)
         assert result == '2024-01-15T14:30:00.123456Z'
 
+    def test_datetime_trailing_zeros_stripped(self):
+        dt = datetime(2024, 1, 15, 14, 30, 10, 500000)
+        assert normalize_datetime(dt) == '2024-01-15T14:30:10.5Z'
+
+    def test_aware_datetime(self, monkeypatch):
+        import time as time_module
+        if not hasattr(time_module, 'tzset'):
+            pytest.skip("time.tzset not available")
+        monkeypatch.setenv('TZ', 'UTC')
+        time_module.tzset()
+        try:
+            dt = datetime(2024, 1, 15, 16, 30, tzinfo=timezone(timedelta(hours=2)))
+            assert normalize_datetime(dt) == '2024-01-15T14:30:00Z'
+        finally:
+            monkeypatch.undo()
+            time_module.tzset()
+
+    def test_timestamp_truncated_to_microseconds(self):
+        pd = pytest.importorskip("pandas")
+        ts = pd.Timestamp('2024-01-15 14:30:00.123456789')
+        assert normalize_datetime(ts) == '2024-01-15T14:30:00.123456Z'
+
     def test_none(self):
         result = normalize_datetime(None)
         assert result == '\000\000\000'
 
+    def test_nat_is_missing(self):
+        pd = pytest.importorskip("pandas")
+        assert normalize_datetime(pd.NaT) == '\000\000\000'
+
+    def test_array_matches_scalar(self):
+        np = pytest.importorskip("numpy")
+        values = [
+            datetime(2024, 1, 15, 14, 30, 0),
+            datetime(2024, 1, 15, 14, 30, 10, 500000),
+            datetime(1960, 2, 29, 0, 0, 0, 1),
+        ]
+        arr = np.array(values, dtype='datetime64[ns]')
+        assert normalize_datetime_array(arr) == [normalize_datetime(v) for v in values]
+
 
 class TestNormalizeBitfield:
     """Tests for bitfield normalization."""
@@ -16,7 +16,7 @@ pytestmark = pytest.mark.skipif(
 )
 
 if PANDAS_AVAILABLE:
-    from unf import series_unf, dataframe_unf, dataframe_column_unfs, calculate_unf
+    from unf import series_unf, dataframe_unf, dataframe_column_unfs, calculate_unf, combine_unfs
     from unf.unf import UNFConfig
 
 
@@ -65,12 +65,53 @@ class TestSeriesUNF:
         list_unf = calculate_unf([1.0, None, 3.0, None, 5.0])
         assert unf == list_unf
 
+    def test_calculate_unf_accepts_series(self):
+        """Test that calculate_unf on a Series matches its list of values."""
+        for s in (
+            pd.Series([1.5, np.nan, -0.0]),
+            pd.Series([2**60, -3, 0]),
+            pd.Series([True, False]),
+            pd.Series(['a', None, 'c']),
+        ):
+            assert calculate_unf(s) == calculate_unf(s.tolist())
+
+    def test_nullable_integer_series(self):
+        """Test that nullable Int64 values are normalized as numbers."""
+        s = pd.Series([1, None, 3], dtype="Int64")
+        assert series_unf(s) == calculate_unf([1, None, 3])
+        assert series_unf(s) == series_unf(pd.Series([1.0, None, 3.0]))
+
+    def test_nullable_boolean_series(self):
+        """Test that nullable boolean values are normalized as numbers."""
+        s = pd.Series([True, None, False], dtype="boolean")
+        assert series_unf(s) == calculate_unf([True, None, False])
+
+    @pytest.mark.parametrize("dtype, values", [
+        ("bool[pyarrow]", [True, None, False]),
+        ("int64[pyarrow]", [1, None, -3]),
+        ("double[pyarrow]", [1.5, None, -0.0]),
+    ])
+    def test_pyarrow_series_with_nulls(self, dtype, values):
+        """Test that pyarrow-backed values are normalized as numbers."""
+        pytest.importorskip("pyarrow")
+        s = pd.Series(values, dtype=dtype)
+        assert series_unf(s) == calculate_unf(values)
+        df = pd.DataFrame({"x": s})
+        assert dataframe_column_unfs(df) == {"x": calculate_unf(values)}
+
     def test_series_with_nat(self):
         """Test UNF calculation for series with NaT (not-a-time)."""
         s = pd.Series([pd.Timestamp('2024-01-01'), pd.NaT, pd.Timestamp('2024-01-03')])
         unf = series_unf(s)
         assert unf.startswith("UNF:6:")
 
+    def test_datetime_series_matches_python_datetimes(self):
+        """Test that bulk datetime formatting matches element-wise normalization."""
+        from datetime import datetime
+        values = [datetime(2024, 1, 1, 12, 0, 0, 250000), None, datetime(1969, 12, 31, 23, 59, 59)]
+        s = pd.Series(values, dtype='datetime64[ns]')
+        assert series_unf(s) == calculate_unf(values)
+
     def test_series_with_custom_config(self):
         """Test UNF calculation with custom configuration."""
         s = pd.Series([3.14159, 2.71828])
@@ -180,6 +221,15 @@ class TestDataFrameUNF:
         unf2 = dataframe_unf(df)
         assert unf1 == unf2
 
+    def test_dataframe_parallel_matches_sequential(self):
+        """Test that computing columns in worker processes gives the same UNF."""
+        df = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': [1.5, None, 3.5],
+            'c': ['x', 'y', None]
+        })
+        assert dataframe_unf(df, max_workers=2) == dataframe_unf(df)
+
     def test_dataframe_mixed_types(self):
         """Test UNF for DataFrame with mixed column types."""
         df = pd.DataFrame({
@@ -230,6 +280,33 @@ class TestDataFrameColumnUNFs:
         assert unfs['a'] == series_unf(df['a'])
         assert unfs['b'] == series_unf(df['b'])
 
+    def test_combined_column_unfs_match_dataframe(self):
+        """Test that combining column UNFs gives the DataFrame UNF."""
+        df = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': ['x', None, 'z']
+        })
+        unfs = dataframe_column_unfs(df)
+
+        assert combine_unfs(list(unfs.values())) == dataframe_unf(df)
+
+    def test_identical_columns(self):
+        """Test that duplicate columns get the same UNF, and only exact ones."""
+        df = pd.DataFrame({
+            'a': [0.0, 1.5, 2.5],
+            'b': [0.0, 1.5, 2.5],
+            'c': [-0.0, 1.5, 2.5]
+        })
+        unfs = dataframe_column_unfs(df)
+
+        assert unfs['a'] == unfs['b'] == series_unf(df['a'])
+        assert unfs['c'] == series_unf(df['c']) != unfs['a']
+
+    def test_column_unfs_parallel_matches_sequential(self):
+        """Test that column UNFs from worker processes match sequential ones."""
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', None, 'z']})
+        assert dataframe_column_unfs(df, max_workers=2) == dataframe_column_unfs(df)
+
     def test_column_unfs_with_custom_config(self):
         """Test column UNFs with custom configuration."""
         df = pd.DataFrame({
@@ -281,3 +358,12 @@ class TestPandasIntegration:
         s = pd.Series(['A', 'B', 'C', 'A', 'B'], dtype='category')
         unf = series_unf(s)
         assert unf.startswith("UNF:6:")
+
+    def test_categorical_matches_values(self):
+        """Test that categorical series hash like their values."""
+        s = pd.Series(['A', None, 'C', 'A', 'B'], dtype='category')
+        assert series_unf(s) == calculate_unf(['A', None, 'C', 'A', 'B'])
+        assert series_unf(s) == series_unf(s.astype(object))
+
+        s = pd.Series([1, 2, None, 2], dtype='category')
+        assert series_unf(s) == calculate_unf([1, 2, None, 2])
@@ -7,20 +7,13 @@ of NaN, which is superior to pandas).
 
 import pytest
 
+pl = pytest.importorskip("polars")
+
 
 class TestPolarsIntegration:
     """Test polars Series and DataFrame UNF calculations."""
 
-    @pytest.fixture
-    def pl(self):
-        """Import polars, skip tests if not available."""
-        try:
-            import polars
-            return polars
-        except ImportError:
-            pytest.skip("polars not installed")
-
-    def test_series_unf_basic(self, pl):
+    def test_series_unf_basic(self):
         """Test UNF calculation for a simple polars Series."""
         from unf.polars_unf import series_unf
 
@@ -30,7 +23,7 @@ class TestPolarsIntegration:
         assert unf.startswith("UNF:6:")
         assert len(unf) > 10
 
-    def test_series_unf_with_nulls(self, pl):
+    def test_series_unf_with_nulls(self):
         """Test that polars null values are handled correctly."""
         from unf.polars_unf import series_unf
         from unf import calculate_unf
@@ -46,7 +39,7 @@ class TestPolarsIntegration:
         # Should match because polars converts null → None
         assert unf_polars == unf_direct
 
-    def test_series_unf_preserves_nan(self, pl):
+    def test_series_unf_preserves_nan(self):
         """Test that polars preserves NaN (distinct from null)."""
         from unf.polars_unf import series_unf
         from unf import calculate_unf
@@ -64,7 +57,7 @@ class TestPolarsIntegration:
         # So they will actually match. This documents the behavior.
         # If we wanted to preserve NaN, we'd need to modify calculate_unf
 
-    def test_series_unf_strings(self, pl):
+    def test_series_unf_strings(self):
         """Test UNF calculation for string data."""
         from unf.polars_unf import series_unf
 
@@ -73,7 +66,7 @@ class TestPolarsIntegration:
 
         assert unf.startswith("UNF:6:")
 
-    def test_series_unf_strings_with_nulls(self, pl):
+    def test_series_unf_strings_with_nulls(self):
         """Test string data with null values."""
         from unf.polars_unf import series_unf
 
@@ -82,7 +75,7 @@ class TestPolarsIntegration:
 
         assert unf.startswith("UNF:6:")
 
-    def test_dataframe_unf_basic(self, pl):
+    def test_dataframe_unf_basic(self):
         """Test UNF calculation for a polars DataFrame."""
         from unf.polars_unf import dataframe_unf
 
@@ -95,7 +88,7 @@ class TestPolarsIntegration:
         unf = dataframe_unf(df)
         assert unf.startswith("UNF:6:")
 
-    def test_dataframe_unf_with_nulls(self, pl):
+    def test_dataframe_unf_with_nulls(self):
         """Test DataFrame UNF with missing values."""
         from unf.polars_unf import dataframe_unf
 
@@ -108,7 +101,25 @@ class TestPolarsIntegration:
         unf = dataframe_unf(df)
         assert unf.startswith("UNF:6:")
 
-    def test_dataframe_unf_empty(self, pl):
+    def test_dataframe_unf_parallel_matches_sequential(self):
+        """Test that computing columns in worker processes gives the same UNF."""
+        from unf.polars_unf import dataframe_unf
+
+        df = pl.DataFrame({
+            'a': [1, 2, 3],
+            'b': [1.5, None, 3.5],
+            'c': ['x', 'y', None]
+        })
+        assert dataframe_unf(df, max_workers=2) == dataframe_unf(df)
+
+    def test_column_unfs_parallel_matches_sequential(self):
+        """Test that column UNFs from worker processes match sequential ones."""
+        from unf.polars_unf import dataframe_column_unfs
+
+        df = pl.DataFrame({'a': [1, 2, 3], 'b': ['x', None, 'z']})
+        assert dataframe_column_unfs(df, max_workers=2) == dataframe_column_unfs(df)
+
+    def test_dataframe_unf_empty(self):
         """Test UNF for empty DataFrame."""
         from unf.polars_unf import dataframe_unf
 
@@ -117,7 +128,7 @@ class TestPolarsIntegration:
 
         assert unf.startswith("UNF:6:")
 
-    def test_dataframe_unf_order_independence(self, pl):
+    def test_dataframe_unf_order_independence(self):
         """Test that column order doesn't affect DataFrame UNF."""
         from unf.polars_unf import dataframe_unf
 
@@ -136,7 +147,7 @@ class TestPolarsIntegration:
 
         assert unf1 == unf2
 
-    def test_dataframe_column_unfs(self, pl):
+    def test_dataframe_column_unfs(self):
         """Test getting individual column UNFs."""
         from unf.polars_unf import dataframe_column_unfs
 
@@ -153,14 +164,14 @@ class TestPolarsIntegration:
         assert unfs['id'].startswith('UNF:6:')
         assert unfs['name'].startswith('UNF:6:')
 
-    def test_series_type_validation(self, pl):
+    def test_series_type_validation(self):
         """Test that series_unf validates input type."""
         from unf.polars_unf import series_unf
 
         with pytest.raises(TypeError, match="Expected pl.Series"):
             series_unf([1, 2, 3])
 
-    def test_dataframe_type_validation(self, pl):
+    def test_dataframe_type_validation(self):
         """Test that dataframe_unf validates input type."""
         from unf.polars_unf import dataframe_unf
 
@@ -171,25 +182,12 @@ class TestPolarsIntegration:
 class TestPolarsVsPandas:
     """Compare polars and pandas implementations."""
 
-    @pytest.fixture
-    def pl(self):
-        """Import polars, skip if not available."""
-        try:
-            import polars
-            return polars
-        except ImportError:
-            pytest.skip("polars not installed")
-
     @pytest.fixture
     def pd(self):
         """Import pandas, skip if not available."""
-        try:
-            import pandas
-            return pandas
-        except ImportError:
-            pytest.skip("pandas not installed")
+        return pytest.importorskip("pandas")
 
-    def test_polars_pandas_equivalence_basic(self, pl, pd):
+    def test_polars_pandas_equivalence_basic(self, pd):
         """Test that polars and pandas produce the same UNF for basic data."""
         from unf.polars_unf import series_unf as polars_series_unf
         from unf.pandas_unf import series_unf as pandas_series_unf
@@ -204,7 +202,7 @@ class TestPolarsVsPandas:
 
         assert unf_polars == unf_pandas
 
-    def test_polars_pandas_equivalence_with_nulls(self, pl, pd):
+    def test_polars_pandas_equivalence_with_nulls(self, pd):
         """Test that polars and pandas produce the same UNF for data with nulls."""
         from unf.polars_unf import series_unf as polars_series_unf
         from unf.pandas_unf import series_unf as pandas_series_unf
@@ -219,7 +217,7 @@ class TestPolarsVsPandas:
 
         assert unf_polars == unf_pandas
 
-    def test_polars_pandas_dataframe_equivalence(self, pl, pd):
+    def test_polars_pandas_dataframe_equivalence(self, pd):
         """Test that DataFrame UNFs match between polars and pandas."""
         from unf.polars_unf import dataframe_unf as polars_df_unf
         from unf.pandas_unf import dataframe_unf as pandas_df_unf
@@ -241,16 +239,7 @@ class TestPolarsVsPandas:
 class TestPolarsNullHandling:
     """Test polars' superior null handling."""
 
-    @pytest.fixture
-    def pl(self):
-        """Import polars, skip if not available."""
-        try:
-            import polars
-            return polars
-        except ImportError:
-            pytest.skip("polars not installed")
-
-    def test_polars_converts_null_to_none(self, pl):
+    def test_polars_converts_null_to_none(self):
         """Test that polars.to_list() converts null to None."""
         s = pl.Series([1.0, 2.0, None, 4.0])
         as_list = s.to_list()
@@ -258,7 +247,7 @@ class TestPolarsNullHandling:
         # Third element should be Python None
         assert as_list[2] is None
 
-    def test_polars_preserves_nan_in_list(self, pl):
+    def test_polars_preserves_nan_in_list(self):
         """Test that polars preserves NaN when explicitly provided."""
         import math
 
@@ -269,7 +258,7 @@ class TestPolarsNullHandling:
         assert isinstance(as_list[2], float)
         assert math.isnan(as_list[2])
 
-    def test_polars_null_vs_nan_distinction(self, pl):
+    def test_polars_null_vs_nan_distinction(self):
         """Document that polars maintains null vs NaN distinction."""
         import math
 
@@ -284,7 +273,7 @@ class TestPolarsNullHandling:
         assert isinstance(as_list[2], float)
         assert math.isnan(as_list[2])
 
-    def test_polars_integer_with_nulls(self, pl):
+    def test_polars_integer_with_nulls(self):
         """Test that polars can handle integer columns with nulls.
 
         This is a key advantage over pandas, which converts integer
@@ -302,36 +291,43 @@ class TestPolarsNullHandling:
         as_list = s.to_list()
         assert as_list[2] is None
 
+    def test_numeric_series_match_lists(self):
+        """Test that bulk numeric normalization matches the list path."""
+        from unf.polars_unf import series_unf
+        from unf import calculate_unf
+
+        for values, dtype in [
+            ([1, None, 2**62 + 1], pl.Int64),
+            ([True, None, False], pl.Boolean),
+            ([1.5, None, -0.0], pl.Float64),
+        ]:
+            s = pl.Series(values, dtype=dtype)
+            assert series_unf(s) == calculate_unf(values)
+
+    def test_string_series_match_lists(self):
+        """Test that strings hashed from Arrow buffers match the list path."""
+        from unf.polars_unf import series_unf
+        from unf import calculate_unf
+        from unf.unf import UNFConfig
+
+        values = ["héllo", None, "\x00\x00\x00", "", "日本語" * 60]
+        s = pl.concat([pl.Series(values[:2]), pl.Series(values[2:])], rechunk=False)
+        assert series_unf(s) == calculate_unf(values)
+
+        config = UNFConfig(max_chars=3)
+        assert series_unf(s, config) == calculate_unf(values, config)
+
 
 class TestPolarsStataIntegration:
     """Test using polars with Stata file data."""
 
-    @pytest.fixture
-    def pl(self):
-        """Import polars, skip if not available."""
-        try:
-            import polars
-            return polars
-        except ImportError:
-            pytest.skip("polars not installed")
-
-    def test_stata_via_polars_conversion(self, pl):
+    def test_stata_via_polars_conversion(self, mmtalent_columns):
         """Test that Stata data converted through polars works correctly."""
-        try:
-            import pyreadstat
-        except ImportError:
-            pytest.skip("pyreadstat not installed")
-
         from unf.polars_unf import series_unf
 
-        # Read Stata file with pyreadstat (returns pandas)
-        df_pandas, meta = pyreadstat.read_dta(
-            'tests/mmtalent_df.dta',
-            apply_value_formats=False
-        )
-
-        # Convert to polars
-        df_polars = pl.from_pandas(df_pandas)
+        # Build polars columns from the values read by pyreadstat; missing
+        # values stay NaN
+        df_polars = pl.DataFrame(mmtalent_columns)
 
         # Calculate UNF using polars
         unf_polars = series_unf(df_polars['wgt'])
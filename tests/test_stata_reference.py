@@ -15,7 +15,7 @@ R haven version: 2.5.4
 """
 
 import pytest
-from unf import calculate_unf_from_stata
+from unf import calculate_unf, calculate_unf_from_stata
 
 
 # Reference UNF values calculated by R's UNF package v2.0.8
@@ -45,63 +45,18 @@ R_REFERENCE_UNFS = {
 class TestStataReferenceUNFs:
     """Test suite comparing our implementation against R UNF package."""
 
-    @pytest.fixture
-    def stata_unfs(self):
-        """Calculate UNFs for the test Stata file."""
-        return calculate_unf_from_stata("tests/mmtalent_df.dta")
-
-    def test_wgt_matches_r(self, stata_unfs):
-        """Test that wgt (float64 with missing values) matches R."""
-        assert stata_unfs["wgt"] == R_REFERENCE_UNFS["wgt"]
-
-    def test_start_date_matches_r(self, stata_unfs):
-        """Test that start_date (string) matches R."""
-        assert stata_unfs["start_date"] == R_REFERENCE_UNFS["start_date"]
-
-    def test_payment_low_worker_matches_r(self, stata_unfs):
-        """Test that payment_low_worker (float64 with missing) matches R."""
-        assert stata_unfs["payment_low_worker"] == R_REFERENCE_UNFS["payment_low_worker"]
-
-    def test_payment_high_worker_matches_r(self, stata_unfs):
-        """Test that payment_high_worker (float64 with missing) matches R."""
-        assert stata_unfs["payment_high_worker"] == R_REFERENCE_UNFS["payment_high_worker"]
-
-    def test_treatment_matches_r(self, stata_unfs):
-        """Test that treatment (labeled variable) matches R.
+    @pytest.mark.parametrize(
+        "var_name,expected",
+        R_REFERENCE_UNFS.items(),
+        ids=list(R_REFERENCE_UNFS)
+    )
+    def test_matches_r(self, stata_unfs, var_name, expected):
+        """Test that each reference variable matches R.
 
-        R's haven::read_dta() reads labeled variables as numeric codes,
-        not string labels. Our implementation with pyreadstat and
-        apply_value_formats=False replicates this behavior.
+        Labeled variables are read as numeric codes, not string labels, as
+        R's haven::read_dta() does; see test_labeled_variable_uses_numeric_codes.
         """
-        assert stata_unfs["treatment"] == R_REFERENCE_UNFS["treatment"]
-
-    def test_completion_state_matches_r(self, stata_unfs):
-        """Test that completion_state (labeled variable) matches R."""
-        assert stata_unfs["completion_state"] == R_REFERENCE_UNFS["completion_state"]
-
-    def test_gender_matches_r(self, stata_unfs):
-        """Test that gender (labeled variable) matches R."""
-        assert stata_unfs["gender"] == R_REFERENCE_UNFS["gender"]
-
-    def test_education_matches_r(self, stata_unfs):
-        """Test that education (labeled variable) matches R."""
-        assert stata_unfs["education"] == R_REFERENCE_UNFS["education"]
-
-    def test_income_matches_r(self, stata_unfs):
-        """Test that income (labeled variable) matches R."""
-        assert stata_unfs["income"] == R_REFERENCE_UNFS["income"]
-
-    def test_redist_pref_matches_r(self, stata_unfs):
-        """Test that redist_pref (labeled variable) matches R."""
-        assert stata_unfs["redist_pref"] == R_REFERENCE_UNFS["redist_pref"]
-
-    def test_polpref_matches_r(self, stata_unfs):
-        """Test that polpref (labeled variable) matches R."""
-        assert stata_unfs["polpref"] == R_REFERENCE_UNFS["polpref"]
-
-    def test_region_matches_r(self, stata_unfs):
-        """Test that region (string variable) matches R."""
-        assert stata_unfs["region"] == R_REFERENCE_UNFS["region"]
+        assert stata_unfs[var_name] == expected
 
     def test_all_reference_variables_match(self, stata_unfs):
         """Test that all reference variables match R implementation."""
@@ -124,7 +79,7 @@ class TestStataReferenceUNFs:
         The wgt variable has 1796 missing values. This test verifies that
         our automatic NaN -> None conversion produces the same UNF as R.
         """
-        # This is implicitly tested by test_wgt_matches_r, but we make it
+        # This is implicitly tested by test_matches_r, but we make it
         # explicit here to document the importance of NaN handling
         assert stata_unfs["wgt"] == R_REFERENCE_UNFS["wgt"]
 
@@ -143,12 +98,20 @@ class TestStataReferenceUNFs:
         # make it explicit here to document this critical behavior
         assert stata_unfs["treatment"] == R_REFERENCE_UNFS["treatment"]
 
-    def test_deterministic_calculation(self):
+    def test_deterministic_calculation(self, stata_unfs):
         """Test that UNF calculation is deterministic (same result every time)."""
-        unfs1 = calculate_unf_from_stata("tests/mmtalent_df.dta")
-        unfs2 = calculate_unf_from_stata("tests/mmtalent_df.dta")
+        unfs = calculate_unf_from_stata("tests/mmtalent_df.dta")
+
+        assert unfs == stata_unfs, "UNF calculation should be deterministic"
+
+    def test_parallel_matches_sequential(self, stata_unfs):
+        """Test that computing variables in worker processes gives the same UNFs."""
+        assert calculate_unf_from_stata("tests/mmtalent_df.dta", max_workers=2) == stata_unfs
 
-        assert unfs1 == unfs2, "UNF calculation should be deterministic"
+    def test_direct_reader_matches_pyreadstat(self, stata_unfs, mmtalent_columns):
+        """Test that columns read from the memory-mapped file match pyreadstat."""
+        for name, values in mmtalent_columns.items():
+            assert stata_unfs[name] == calculate_unf(values), name
 
     def test_returns_all_variables(self, stata_unfs):
         """Test that UNFs are calculated for all variables in the file."""
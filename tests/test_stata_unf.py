@@ -58,7 +58,7 @@ def test_stata_file_unf():
     mismatches = []
     for col in df.columns:
         expected = EXPECTED_VARIABLE_UNFS.get(col, "N/A")
-        actual = calculate_unf(df[col].tolist())
+        actual = calculate_unf(df[col])
         match = actual == expected
 
         print(f"\n{col}:")
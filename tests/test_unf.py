@@ -2,7 +2,7 @@
 
 import pytest
 from unf import calculate_unf, combine_unfs
-from unf.unf import UNFConfig, calculate_dataset_unf
+from unf.unf import UNFConfig, calculate_dataset_unf, normalize_value
 
 
 class TestUNFConfig:
@@ -32,6 +32,12 @@ class TestUNFConfig:
         assert "X256" in header
         assert "H256" in header
 
+    def test_header_follows_changed_attributes(self):
+        config = UNFConfig()
+        assert config.get_header() == "UNF:6:"
+        config.precision = 9
+        assert config.get_header() == "UNF:6:N9:"
+
     def test_invalid_version(self):
         with pytest.raises(ValueError):
             UNFConfig(version=5)
@@ -41,6 +47,23 @@ class TestUNFConfig:
             UNFConfig(hash_bits=100)
 
 
+class TestNormalizeValue:
+    """Tests for normalize_value type dispatch."""
+
+    def test_boolean_before_integer(self):
+        assert normalize_value(True) == b"+1.e+"
+        assert normalize_value(False) == b"+0.e+"
+
+    def test_subclasses_use_base_normalizer(self):
+        from datetime import datetime
+
+        class Stamp(datetime):
+            pass
+
+        stamp = Stamp(2024, 1, 1, 12, 30)
+        assert normalize_value(stamp) == normalize_value(datetime(2024, 1, 1, 12, 30))
+
+
 class TestCalculateUNF:
     """Tests for calculate_unf function."""
 
@@ -70,6 +93,24 @@ class TestCalculateUNF:
         result = calculate_unf(data)
         assert result.startswith("UNF:6:")
 
+    def test_mixed_types_keep_positions(self):
+        """Mixed-type values are normalized by type but hashed in order."""
+        data1 = [1.0, "hello", 2, None, float('nan')]
+        data2 = ["hello", 1.0, 2, None, float('nan')]
+        assert calculate_unf(data1) != calculate_unf(data2)
+        assert calculate_unf(data1) == calculate_unf([1.0, "hello", 2, None, None])
+
+    def test_iterable_input(self):
+        data = [1.0, "hello", None]
+        assert calculate_unf(iter(data)) == calculate_unf(data)
+
+    def test_nat_is_missing(self):
+        pd = pytest.importorskip("pandas")
+        from datetime import datetime
+
+        dt = datetime(2020, 1, 1)
+        assert calculate_unf([dt, pd.NaT]) == calculate_unf([dt, None])
+
     def test_empty_vector(self):
         data = []
         result = calculate_unf(data)
@@ -97,6 +138,56 @@ class TestCalculateUNF:
         assert result1 != result2
 
 
+class TestNumpyInput:
+    """Tests for calculate_unf with NumPy array input."""
+
+    @pytest.fixture
+    def np(self):
+        """Import numpy, skip tests if not available."""
+        return pytest.importorskip("numpy")
+
+    def test_float_array_matches_list(self, np):
+        data = [3.14159, 2.71828, -0.0, 0.0, 3.14159, 1e-300]
+        assert calculate_unf(np.array(data)) == calculate_unf(data)
+
+    def test_float_array_nan_is_missing(self, np):
+        arr = np.array([1.0, np.nan, 3.0])
+        assert calculate_unf(arr) == calculate_unf([1.0, None, 3.0])
+
+    def test_integer_and_boolean_arrays_match_list(self, np):
+        assert calculate_unf(np.array([1, 2, 3])) == calculate_unf([1, 2, 3])
+        assert calculate_unf(np.array([True, False])) == calculate_unf([True, False])
+
+    def test_masked_array_is_missing(self, np):
+        arr = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+        assert calculate_unf(arr) == calculate_unf([1, None, 3])
+
+    def test_array_spanning_several_chunks(self, np):
+        data = [float(i % 1000) / 7 if i % 11 else None for i in range(40000)]
+        arr = np.array([np.nan if v is None else v for v in data])
+        assert calculate_unf(arr) == calculate_unf(data)
+
+    def test_memoryview_matches_list(self, np):
+        import array
+        floats = array.array('d', [1.5, float('nan'), -0.0])
+        assert calculate_unf(memoryview(floats)) == calculate_unf([1.5, None, -0.0])
+        ints = array.array('q', [2**60, -3])
+        assert calculate_unf(memoryview(ints)) == calculate_unf([2**60, -3])
+
+    def test_python_array_matches_list(self, np):
+        import array
+        floats = array.array('f', [1.5, float('nan'), -0.0])
+        assert calculate_unf(floats) == calculate_unf([1.5, None, -0.0])
+        ints = array.array('q', [2**60, -3])
+        assert calculate_unf(ints) == calculate_unf([2**60, -3])
+        assert calculate_unf(array.array('u', 'ab')) == calculate_unf(['a', 'b'])
+
+    def test_float_array_custom_config(self, np):
+        data = [3.14159265, 2.71828183]
+        config = UNFConfig(precision=9, truncate=True)
+        assert calculate_unf(np.array(data), config) == calculate_unf(data, config)
+
+
 class TestCombineUNFs:
     """Tests for combine_unfs function."""
 
@@ -127,6 +218,12 @@ class TestCombineUNFs:
         result = combine_unfs([unf1])
         assert result.startswith("UNF:6:")
 
+    def test_combine_iterables(self):
+        unf1 = calculate_unf([1.0, 2.0, 3.0])
+        unf2 = calculate_unf([4.0, 5.0, 6.0])
+        assert combine_unfs(unf for unf in [unf2, unf1]) == combine_unfs([unf1, unf2])
+        assert combine_unfs({"x": unf1}.values()) == combine_unfs([unf1])
+
 
 class TestCalculateDatasetUNF:
     """Tests for calculate_dataset_unf function."""
@@ -153,10 +250,30 @@ class TestCalculateDatasetUNF:
 
         assert result1 == result2 == result3
 
+    def test_dataset_mapping(self):
+        data = {"x": [1.0, 2.0], "y": ["a", None]}
+        assert calculate_dataset_unf(data) == calculate_dataset_unf(list(data.values()))
+
+    def test_dataset_generator(self):
+        data = [[1, 2], [3, 4]]
+        result = calculate_dataset_unf(variable for variable in data)
+        assert result == calculate_dataset_unf(data) == "UNF:6:MAb1ovIVcL9irb4BO7c8SQ=="
+
     def test_empty_dataset(self):
         result = calculate_dataset_unf([])
         assert result == "UNF:6:"
 
+    def test_dataset_parallel_matches_sequential(self):
+        data = [[1.0, 2.0, 3.0], ["a", None, "c"], [True, False, True]]
+        assert calculate_dataset_unf(data, max_workers=2) == calculate_dataset_unf(data)
+
+    def test_dataset_identical_numpy_columns(self):
+        np = pytest.importorskip("numpy")
+        a = np.array([0.0, 1.5, 2.5])
+        data = [a, a.copy(), np.array([-0.0, 1.5, 2.5])]
+        expected = combine_unfs([calculate_unf(variable) for variable in data])
+        assert calculate_dataset_unf(data) == expected
+
     def test_mixed_types_dataset(self):
         data = [
             [1.0, 2.0, 3.0],